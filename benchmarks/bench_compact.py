@@ -0,0 +1,75 @@
+"""
+Benchmark the memory held by validated models against their compact representations.
+
+Reports the bytes per instance of ShopOrder and of each model nested in it,
+with their own nested models, measured with tracemalloc over 10,000 instances
+built from the recorded test orders.
+
+    python benchmarks/bench_compact.py
+"""
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+import types
+from collections.abc import Callable
+from pathlib import Path
+from typing import Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from woocommerce_pydantic.wcapi.models import wc_resources
+from woocommerce_pydantic.wcapi.models.wc_compact import to_compact
+
+ORDERS_FILE = Path(__file__).parent.parent / "tests" / "data" / "responses" / "v3" / "orders.json"
+INSTANCES = 10_000
+
+
+def _nested_models(annotation: object) -> list[type[BaseModel]]:
+    """Return the models in an annotation, eg LineItem1 in `list[LineItem1] | None`."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    if get_origin(annotation) in (Union, getattr(types, "UnionType", Union), list):
+        return [model for arg in get_args(annotation) for model in _nested_models(arg)]
+    return []
+
+
+def _payloads(model: type[BaseModel], items: list[dict]) -> dict[type[BaseModel], list[dict]]:
+    """Return the raw items of a model and of the models nested in it, by model."""
+    payloads = {model: items}
+    for name, field_info in model.model_fields.items():
+        for nested_model in _nested_models(field_info.annotation):
+            values = [item[field_info.alias or name] for item in items if item.get(field_info.alias or name)]
+            nested = [value for item in values for value in (item if isinstance(item, list) else [item])]
+            if nested and nested_model not in payloads:
+                payloads.update(_payloads(nested_model, nested))
+    return payloads
+
+
+def _retained(build: Callable[[], list]) -> int:
+    """Return the bytes still allocated by the result of `build()`."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    payloads = _payloads(wc_resources.ShopOrder, json.loads(ORDERS_FILE.read_text()))
+    print(f"{'model':<20} {'model B':>9} {'compact B':>10} {'saving':>7}")  # noqa: T201
+    for model, items in payloads.items():
+        # Serialised once, so both builds start from the same JSON
+        samples = [json.dumps(items[n % len(items)]) for n in range(INSTANCES)]
+        models = _retained(lambda: [model.model_validate_json(sample) for sample in samples])  # noqa: B023
+        compacts = _retained(lambda: [to_compact(model.model_validate_json(sample)) for sample in samples])  # noqa: B023
+        print(  # noqa: T201
+            f"{model.__name__:<20} {models / INSTANCES:9.0f} {compacts / INSTANCES:10.0f} {models / compacts:6.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark WooDataResponse.data() on a 100-item ShopOrderList.
+
+Compares the previous two-pass approach (stdlib `json` into Python objects,
+then pydantic validation) with the single-pass `model_validate_json()`.
+
+    python benchmarks/bench_data_parse.py
+"""
+from __future__ import annotations
+
+import json
+import timeit
+from pathlib import Path
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+ORDERS_FILE = Path(__file__).parent.parent / "tests" / "data" / "responses" / "v3" / "orders.json"
+ITEMS = 100
+REPEAT = 5
+NUMBER = 50
+
+
+def orders_payload(items: int = ITEMS) -> bytes:
+    """Return a JSON array of `items` orders, repeating the recorded test orders."""
+    orders = json.loads(ORDERS_FILE.read_text())
+    payload = [{**orders[n % len(orders)], "id": n + 1} for n in range(items)]
+    return json.dumps(payload).encode()
+
+
+def main() -> None:
+    content = orders_payload()
+    model = wc_collections.ShopOrderList
+
+    timings = {
+        "json.loads + model()": lambda: model(json.loads(content)),
+        "model_validate_json()": lambda: model.model_validate_json(content),
+    }
+    results = {}
+    for name, func in timings.items():
+        results[name] = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"{name:<24} {results[name] * 1000:8.3f} ms per page")  # noqa: T201
+
+    baseline, fast = results.values()
+    print(f"speed-up: {baseline / fast:.2f}x ({len(content) / 1024:.0f} KiB, {ITEMS} orders)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
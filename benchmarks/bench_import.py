@@ -0,0 +1,58 @@
+"""
+Benchmark the cold-start cost of the package, measured with `python -X importtime`.
+
+Each target is imported in a fresh interpreter, and the best cumulative time
+of several runs is reported. The last target also validates one order, which
+includes building the deferred schemas of ShopOrder and its nested models.
+
+    python benchmarks/bench_import.py
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+import time
+
+RUNS = 5
+IMPORTS = (
+    "woocommerce_pydantic",
+    "woocommerce_pydantic.wcapi.models.wc_resources",
+    "woocommerce_pydantic.wcapi.wc_api",
+)
+FIRST_ORDER = (
+    "from woocommerce_pydantic.wcapi.models.wc_resources import ShopOrder; "
+    "ShopOrder.model_validate_json(b'{\"id\": 1, \"status\": \"completed\", \"line_items\": [{\"id\": 2}]}')"
+)
+
+
+def import_time(module: str) -> float:
+    """Return the cumulative import time of a module in seconds, from `-X importtime`."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    pattern = rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$"
+    return int(re.search(pattern, result.stderr, re.MULTILINE).group(1)) / 1e6
+
+
+def run_time(code: str) -> float:
+    """Return the wall time of running code in a fresh interpreter, in seconds."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    for module in IMPORTS:
+        best = min(import_time(module) for _ in range(RUNS))
+        print(f"import {module:<48} {best * 1000:8.1f} ms")  # noqa: T201
+    baseline = min(run_time("pass") for _ in range(RUNS))
+    best = min(run_time(FIRST_ORDER) for _ in range(RUNS))
+    print(f"{'import and validate a first ShopOrder':<55} {(best - baseline) * 1000:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark the peak memory of data() against iter_data() on a large ShopOrderList response.
+
+    python benchmarks/bench_stream.py
+"""
+from __future__ import annotations
+
+import io
+import tracemalloc
+from collections.abc import Callable
+
+from bench_data_parse import orders_payload
+from requests import Response
+
+from woocommerce_pydantic.wcapi.wc_api import WooDataResponse
+
+ITEMS = 1000
+
+
+def _response(content: bytes) -> WooDataResponse:
+    """Return a streamed response, reading the body from memory."""
+    response = Response()
+    response.url = "https://example.com/wp-json/wc/v3/orders"
+    response.status_code = 200
+    response.raw = io.BytesIO(content)
+    return WooDataResponse(response)
+
+
+def _peak(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    content = orders_payload(ITEMS)
+
+    def consume_data() -> None:
+        for order in _response(content).data().root:
+            order.id  # noqa: B018
+
+    def consume_iter_data() -> None:
+        for order in _response(content).iter_data():
+            order.id  # noqa: B018
+
+    print(f"response body {len(content) / 1e6:8.2f} MB for {ITEMS} orders")  # noqa: T201
+    results = {"data()": _peak(consume_data), "iter_data()": _peak(consume_iter_data)}
+    for name, peak in results.items():
+        print(f"{name:<13} {peak / 1e6:8.2f} MB peak")  # noqa: T201
+
+    data, streamed = results.values()
+    print(f"reduction: {data / streamed:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmark trusted construction against validation on a 100-item ShopOrderList.
+
+    python benchmarks/bench_trusted.py
+"""
+from __future__ import annotations
+
+import timeit
+
+from bench_data_parse import NUMBER, REPEAT, orders_payload
+from pydantic_core import from_json
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_construct
+
+
+def main() -> None:
+    content = orders_payload()
+    model = wc_collections.ShopOrderList
+    assert wc_construct.construct(model, from_json(content)) == model.model_validate_json(content)  # noqa: S101
+
+    timings = {
+        "validated": lambda: model.model_validate_json(content),
+        "trusted": lambda: wc_construct.construct(model, from_json(content)),
+    }
+    results = {}
+    for name, func in timings.items():
+        results[name] = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"{name:<12} {results[name] * 1000:8.3f} ms per page")  # noqa: T201
+
+    validated, trusted = results.values()
+    print(f"speed-up: {validated / trusted:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
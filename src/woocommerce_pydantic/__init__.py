@@ -1,4 +1,15 @@
-from woocommerce_pydantic.wcapi.wc_api import API
+from __future__ import annotations
+
+
+def __getattr__(name: str) -> object:
+    # Import the API on first use, so importing the models alone does not load requests and woocommerce
+    if name == "API":
+        from woocommerce_pydantic.wcapi.wc_api import API  # noqa: PLC0415
+
+        return API
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 def hello() -> str:
     return "Hello from woocommerce-pydantic!"
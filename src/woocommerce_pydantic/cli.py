@@ -0,0 +1,158 @@
+"""
+Command line interface, installed as the `woocommerce-pydantic` script.
+
+    woocommerce-pydantic export orders --output orders.ndjson.gz --since 2025-01-01T00:00:00 --concurrency 4
+
+The store url and credentials are read from the `--url`, `--consumer-key` and
+`--consumer-secret` options, or the `WC_URL`, `WC_CONSUMER_KEY` and
+`WC_CONSUMER_SECRET` environment variables, which may be set in a `.env` file.
+
+`export` writes the validated resources of a collection endpoint to NDJSON,
+one resource per line, gzip compressed when the output ends with ".gz".
+Pages are written as they are fetched, so memory use does not grow with the
+size of the export. After each page, the next page and the output size are
+saved to a checkpoint file; running the same export again after an
+interruption resumes from the last completed page.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from requests import RequestException
+
+from woocommerce_pydantic.wcapi.wc_api import API
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface, returning the exit status."""
+    load_dotenv()
+    parser = _parser()
+    args = parser.parse_args(argv)
+    for option in ("url", "consumer_key", "consumer_secret"):
+        if not getattr(args, option):
+            parser.error(f"--{option.replace('_', '-')} or WC_{option.upper()} is required.")
+    return args.command(args)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="woocommerce-pydantic", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--url", default=os.environ.get("WC_URL"), help="Store url, eg https://example.com.")
+    parser.add_argument("--consumer-key", default=os.environ.get("WC_CONSUMER_KEY"))
+    parser.add_argument("--consumer-secret", default=os.environ.get("WC_CONSUMER_SECRET"))
+    parser.add_argument("--api-version", default="wc/v3", help="API version, wc/v3 by default.")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds.")
+    commands = parser.add_subparsers(required=True, metavar="command")
+
+    export = commands.add_parser("export", help="Export a collection endpoint to NDJSON.")
+    export.set_defaults(command=export_command)
+    export.add_argument("endpoint", help='Collection endpoint, eg "orders" or "products/12/variations".')
+    export.add_argument("-o", "--output", default="-", help='Output file, gzip compressed for ".gz", stdout for "-".')
+    export.add_argument("--since", help="Only export resources modified after this GMT date, eg 2025-01-01T00:00:00.")
+    export.add_argument("--fields", help="Comma separated fields to export, eg id,status,billing.email.")
+    export.add_argument("--concurrency", type=int, default=1, help="Number of pages fetched concurrently.")
+    export.add_argument("--per-page", type=int, default=100, help="Number of resources requested per page.")
+    export.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Extra query parameter, eg status=completed. May be repeated.",
+    )
+    export.add_argument("--checkpoint", help="Checkpoint file, the output file with a .checkpoint suffix by default.")
+    export.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over.")
+    return parser
+
+
+def export_command(args: argparse.Namespace) -> int:
+    """Export a collection endpoint to NDJSON, resuming from the checkpoint of an interrupted export."""
+    params = dict(param.split("=", 1) for param in args.param)
+    if args.since:
+        params.update(modified_after=args.since, dates_are_gmt="true")
+    fields = args.fields.split(",") if args.fields else None
+    to_stdout = args.output == "-"
+    output = Path(args.output)
+    checkpoint_path = None if to_stdout else Path(args.checkpoint or f"{args.output}.checkpoint")
+    # The checkpoint only applies to the same export
+    export = {"endpoint": args.endpoint, "params": params, "fields": fields}
+
+    start_page, offset = 1, 0
+    if checkpoint_path is not None and checkpoint_path.exists() and not args.restart:
+        checkpoint = json.loads(checkpoint_path.read_text())
+        if checkpoint["export"] != export:
+            msg = f"{checkpoint_path} is the checkpoint of another export, use --restart to overwrite it."
+            print(msg, file=sys.stderr)  # noqa: T201
+            return 2
+        start_page, offset = checkpoint["next_page"], checkpoint["offset"]
+    if not to_stdout:
+        # Drop anything written after the last completed page
+        with output.open("ab") as file:
+            file.truncate(offset)
+
+    exported = 0
+    api = API(args.url, args.consumer_key, args.consumer_secret, version=args.api_version, timeout=args.timeout)
+    try:
+        with api:
+            pages = api.iter_numbered_pages(
+                args.endpoint,
+                params=params,
+                per_page=args.per_page,
+                workers=args.concurrency,
+                start_page=start_page,
+                fields=fields,
+            )
+            for page_number, page in pages:
+                lines = b"".join(_ndjson_line(item) for item in page.root)
+                if to_stdout:
+                    sys.stdout.buffer.write(lines)
+                    sys.stdout.buffer.flush()
+                else:
+                    offset = _append(output, lines)
+                    checkpoint = {"export": export, "next_page": page_number + 1, "offset": offset}
+                    _save_checkpoint(checkpoint_path, checkpoint)
+                exported += len(page.root)
+    except (RequestException, ValueError) as exc:
+        print(f"Export of {args.endpoint} failed after {exported} resources: {exc}", file=sys.stderr)  # noqa: T201
+        if checkpoint_path is not None:
+            print(f"Run the same command again to resume from {checkpoint_path}.", file=sys.stderr)  # noqa: T201
+        return 1
+
+    if checkpoint_path is not None:
+        checkpoint_path.unlink(missing_ok=True)
+    print(f"Exported {exported} resources of {args.endpoint}.", file=sys.stderr)  # noqa: T201
+    return 0
+
+
+def _append(output: Path, lines: bytes) -> int:
+    """Append lines to the output and sync it to disk, returning its size."""
+    with output.open("ab") as file:
+        if output.suffix == ".gz":
+            # Each page is its own gzip member, so the file can be cut after any page
+            with gzip.GzipFile(fileobj=file, mode="ab") as gzip_file:
+                gzip_file.write(lines)
+        else:
+            file.write(lines)
+        file.flush()
+        os.fsync(file.fileno())
+        return file.tell()
+
+
+def _ndjson_line(item: BaseModel) -> bytes:
+    return item.model_dump_json(by_alias=True, exclude_unset=True).encode() + b"\n"
+
+
+def _save_checkpoint(path: Path, checkpoint: dict) -> None:
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(checkpoint, indent=2))
+    temp_path.replace(path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""
+Pydantic models of the WooCommerce API, and the helpers mapping endpoints to them.
+
+Defining the ~150 models of `wc_resources` and `wc_collections`, and the
+endpoint routes of `wc_endpoints`, is most of the import cost of the package.
+Importing the package does not import them, or the helpers depending on them:
+each submodule is imported on first access, eg `models.wc_resources`, and is
+then the real module. `wc_api` only accesses them once a response is mapped
+to a model.
+"""
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+LAZY_MODULES = ("wc_collections", "wc_construct", "wc_endpoints", "wc_projection", "wc_resources", "wc_validators")
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Only called while the submodule is not imported, as importing it sets it on the package
+    if name in LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,12 +1,39 @@
 """Defines Pydantic response models for WooCommerce API endpoints that return a list."""
 
-from pydantic import RootModel
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import get_args
+
+from pydantic import ConfigDict, RootModel
 
 from woocommerce_pydantic.wcapi.models import wc_resources
 
 
 class WooCommerceCollection(RootModel):
-    pass
+    # Build validators and serializers on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def item_model(cls) -> type[wc_resources.WooCommerceResource]:
+        """Return the model of the items in the collection, eg ShopOrder for ShopOrderList."""
+        return get_args(cls.model_fields["root"].annotation)[0]
+
+    def to_columns(self, fields: Iterable[str] | None = None) -> dict:
+        """
+        Return the items as typed NumPy columns, see `wc_columns.to_columns()`.
+
+        Args:
+            fields (Iterable[str] | None): The fields to export, eg ("total", "status").
+
+        Returns:
+            dict[str, Column]: An array or `wc_columns.Categorical` per field.
+
+        """
+        from woocommerce_pydantic.wcapi.models import wc_columns  # noqa: PLC0415
+
+        return wc_columns.to_columns(self, fields)
+
 
 class ShopCouponList(WooCommerceCollection[list[wc_resources.ShopCoupon]]):
     pass
@@ -142,3 +169,52 @@ class DataCountriesList(WooCommerceCollection[list[wc_resources.DataCountries]])
 
 class DataCurrenciesList(WooCommerceCollection[list[wc_resources.DataCurrencies]]):
     pass
+
+
+class LazyCollection(Sequence):
+    """
+    Collection of raw item payloads, each validated only when accessed.
+
+    Items are validated into the item model of the collection on index or
+    iteration, and the validated item is cached in place of its payload.
+    """
+
+    def __init__(self, model: type[WooCommerceCollection], items: list[dict]) -> None:
+        """
+        Wrap raw item payloads of a collection.
+
+        Args:
+            model (type[WooCommerceCollection]): The collection model, eg ProductList.
+            items (list[dict]): The decoded JSON items.
+
+        """
+        self.model = model
+        self.item_model = model.item_model()
+        self._raw: list[dict | None] = items
+        self._items: list[wc_resources.WooCommerceResource | None] = [None] * len(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int | slice) -> wc_resources.WooCommerceResource | list:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self.item_model.model_validate(self._raw[index])
+            self._raw[index] = None
+        return item
+
+    def __iter__(self) -> Iterator[wc_resources.WooCommerceResource]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def raw(self, index: int) -> dict:
+        """Return the raw payload of an item, without validating it."""
+        if (item := self._items[index]) is not None:
+            return item.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        return self._raw[index]
+
+    def validate(self) -> WooCommerceCollection:
+        """Validate every item and return the collection model."""
+        return self.model.model_construct(list(self))
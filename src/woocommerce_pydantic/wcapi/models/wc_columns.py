@@ -0,0 +1,228 @@
+"""
+Columnar export of collections to NumPy arrays, for vectorised analytics.
+
+`to_columns()` converts the items of a collection, or of all the pages of a
+page iterator, to one typed array per field:
+
+    columns = to_columns(wcapi.iter_pages("orders"), fields=("total", "status", "date_created_gmt", "billing.country"))
+    revenue = columns["total"].sum()
+    completed = columns["status"].codes == columns["status"].categories.index("completed")
+
+Fields are converted by their annotation and name:
+
+- amounts held as strings, listed in `DECIMAL_FIELDS`, eg `total`, to float64
+  with NaN for empty values,
+- dates held as strings, named `date_*`, to datetime64[s] with NaT for empty values,
+- int to int64, or to float64 with NaN when values are missing, float to
+  float64, and bool to bool, or to object when values are missing,
+- enums, eg `Status` and `Currency`, to a `Categorical` of int16 codes,
+- other fields to object arrays.
+
+Nested fields are selected with dots, eg "billing.country". Without `fields`,
+all the fields of the item model except nested models and lists are exported.
+
+NumPy is an optional dependency, installed with the `columns` extra, and
+`to_arrow()` also needs `pyarrow`.
+"""
+from __future__ import annotations
+
+import types
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+import numpy as np
+from pydantic import BaseModel
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Origins of Union annotations, and of `X | Y` ones from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+# String fields holding amounts
+DECIMAL_FIELDS = frozenset(
+    {
+        "amount",
+        "cart_tax",
+        "discount_tax",
+        "discount_total",
+        "maximum_amount",
+        "minimum_amount",
+        "price",
+        "rate",
+        "regular_price",
+        "sale_price",
+        "shipping_tax",
+        "shipping_tax_total",
+        "shipping_total",
+        "subtotal",
+        "subtotal_tax",
+        "tax_total",
+        "total",
+        "total_sales",
+        "total_shipping",
+        "total_tax",
+        "weight",
+    },
+)
+
+
+@dataclass(frozen=True)
+class Categorical:
+    """Enum values encoded as indexes into their categories, -1 for missing values."""
+
+    codes: np.ndarray
+    categories: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> np.ndarray:
+        """Return the values as an object array, with None for missing values."""
+        values = np.array([*self.categories, None], dtype=object)
+        return values[self.codes]
+
+
+Column = Union[np.ndarray, Categorical]
+
+
+def to_columns(
+    pages: wc_collections.WooCommerceCollection | Iterable[wc_collections.WooCommerceCollection],
+    fields: Iterable[str] | None = None,
+) -> dict[str, Column]:
+    """
+    Convert the items of a collection, or of a sequence of pages, to typed columns.
+
+    Each page is converted as it is read, so the pages of a page iterator,
+    eg `API.iter_pages()`, are not all held in memory.
+
+    Args:
+        pages (WooCommerceCollection | Iterable[WooCommerceCollection]): A
+            collection, or pages of the same collection endpoint.
+        fields (Iterable[str] | None): The fields to export, eg ("total", "billing.country").
+
+    Returns:
+        dict[str, Column]: An array or `Categorical` per field, in the order of
+            `fields`. Empty when there are no pages.
+
+    Raises:
+        ValueError: If a field is not a field of the item model.
+
+    """
+    if isinstance(pages, wc_collections.WooCommerceCollection):
+        pages = [pages]
+    fields = tuple(fields) if fields is not None else None
+    chunks = []
+    for page in pages:
+        model = page.item_model()
+        page_fields = fields if fields is not None else _scalar_fields(model)
+        chunks.append({field: _column(model, field, page.root) for field in page_fields})
+    if len(chunks) <= 1:
+        return chunks[0] if chunks else {}
+    return {field: _concatenate([chunk[field] for chunk in chunks]) for field in chunks[0]}
+
+
+def to_arrow(columns: dict[str, Column]) -> pa.Table:
+    """
+    Return columns as an Arrow table, with `Categorical` columns as dictionary arrays.
+
+    Args:
+        columns (dict[str, Column]): Columns returned by `to_columns()`.
+
+    Returns:
+        pyarrow.Table: The table.
+
+    """
+    import pyarrow as pa  # noqa: PLC0415
+
+    arrays = {}
+    for name, column in columns.items():
+        if isinstance(column, Categorical):
+            indices = pa.array(column.codes, mask=column.codes < 0)
+            arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(column.categories))
+        elif column.dtype == object:
+            values = (value.model_dump(mode="json") if isinstance(value, BaseModel) else value for value in column)
+            arrays[name] = pa.array(list(values))
+        else:
+            arrays[name] = pa.array(column, from_pandas=True)
+    return pa.table(arrays)
+
+
+def _scalar_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    """Return the fields of a model which are not nested models or lists."""
+    return tuple(name for name, field_info in model.model_fields.items() if _is_scalar(field_info.annotation))
+
+
+def _is_scalar(annotation: Any) -> bool:  # noqa: ANN401
+    field_type = _scalar_type(annotation)
+    return not (isinstance(field_type, type) and issubclass(field_type, (BaseModel, list, dict)))
+
+
+def _scalar_type(annotation: Any) -> Any:  # noqa: ANN401
+    """Return an annotation without None, eg str for `str | None`."""
+    if get_origin(annotation) in _UNION_ORIGINS:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return annotation
+        annotation = args[0]
+    return get_origin(annotation) or annotation
+
+
+def _field_type(model: type[BaseModel], path: str) -> Any:  # noqa: ANN401
+    """Return the type of a field, following nested models for dotted paths."""
+    annotation: Any = model
+    for name in path.split("."):
+        is_model = isinstance(annotation, type) and issubclass(annotation, BaseModel)
+        if (field_info := annotation.model_fields.get(name) if is_model else None) is None:
+            msg = f"'{path}' is not a field of {model.__name__}."
+            raise ValueError(msg)
+        annotation = _scalar_type(field_info.annotation)
+    return annotation
+
+
+def _values(items: Iterable[BaseModel], path: str) -> list:
+    names = path.split(".")
+    values = []
+    for item in items:
+        value = item
+        for name in names:
+            value = getattr(value, name, None)
+            if value is None:
+                break
+        values.append(value)
+    return values
+
+
+def _column(model: type[BaseModel], path: str, items: list[BaseModel]) -> Column:  # noqa: PLR0911
+    """Return the typed array of a field of the items."""
+    field_type = _field_type(model, path)
+    values = _values(items, path)
+    name = path.rsplit(".", 1)[-1]
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        categories = tuple(member.value for member in field_type)
+        index = {member: code for code, member in enumerate(field_type)}
+        return Categorical(np.array([index.get(value, -1) for value in values], dtype=np.int16), categories)
+    if field_type is str and name in DECIMAL_FIELDS:
+        return np.array([float(value) if value else np.nan for value in values], dtype=np.float64)
+    if field_type is str and name.startswith("date_"):
+        return np.array([value or None for value in values], dtype="datetime64[s]")
+    missing = None in values
+    if field_type is bool and not missing:
+        return np.array(values, dtype=np.bool_)
+    if field_type is int:
+        return np.array(values, dtype=np.float64 if missing else np.int64)
+    if field_type is float:
+        return np.array(values, dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _concatenate(columns: list[Column]) -> Column:
+    if isinstance(columns[0], Categorical):
+        return Categorical(np.concatenate([column.codes for column in columns]), columns[0].categories)
+    return np.concatenate(columns)
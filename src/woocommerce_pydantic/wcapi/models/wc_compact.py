@@ -0,0 +1,174 @@
+"""
+Compact read-only representations of resource models.
+
+A pydantic model instance holds its values in a per-instance `__dict__`, plus
+a set of the fields that were set. For jobs holding hundreds of thousands of
+resources in memory, `to_compact()` converts validated models, including their
+nested models, to instances of frozen classes with `__slots__`, generated from
+each `wc_resources` model:
+
+    orders = to_compact(wcapi.get("orders").data())   # tuple[CompactShopOrder, ...]
+    orders[0].billing.email
+    order = orders[0].to_model()                        # back to a ShopOrder
+
+Fields that are unset, or set to None when None is their default, are not
+stored: reading them returns the field's default. Lists become tuples, so
+compact resources cannot be mutated; dict values, such as meta data values,
+are kept as they are.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import cache
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+_object_setattr = object.__setattr__
+
+
+class CompactResource:
+    """Base class of the compact classes generated by `compact_class()`."""
+
+    __slots__ = ()
+
+    # The model the class was generated from
+    _model: ClassVar[type[BaseModel]]
+    # (name, slot descriptor) of each field, in the model's field order
+    _slots: ClassVar[tuple[tuple[str, Any], ...]]
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Only called for fields that were not stored
+        field_info = self._model.model_fields.get(name)
+        if field_info is None:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        default = field_info.get_default(call_default_factory=True)
+        return None if default is PydanticUndefined else default
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"{type(self).__name__} is read-only."
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{type(self).__name__} is read-only."
+        raise AttributeError(msg)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return dict(self._items()) == dict(other._items())
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self._items())
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple:
+        # Generated classes cannot be imported by pickle, so rebuild them from their model
+        return _unpickle, (self._model, dict(self._items()))
+
+    def _items(self) -> Iterator[tuple[str, Any]]:
+        """Yield the name and value of each stored field."""
+        for name, slot in self._slots:
+            try:
+                yield name, slot.__get__(self)
+            except AttributeError:
+                continue
+
+    def to_model(self) -> BaseModel:
+        """Return the resource as an instance of the model it was generated from."""
+        return from_compact(self)
+
+
+@cache
+def compact_class(model: type[BaseModel]) -> type[CompactResource]:
+    """
+    Return the compact class of a resource model, generated once per model.
+
+    Args:
+        model (type[BaseModel]): A WooCommerceResource model, eg ShopOrder.
+
+    Returns:
+        type[CompactResource]: A slotted class named after the model, eg CompactShopOrder.
+
+    """
+    names = tuple(model.model_fields)
+    cls = type(
+        f"Compact{model.__name__}",
+        (CompactResource,),
+        {"__slots__": names, "__module__": __name__, "_model": model},
+    )
+    cls._slots = tuple((name, cls.__dict__[name]) for name in names)
+    return cls
+
+
+def to_compact(value: Any) -> Any:  # noqa: ANN401
+    """
+    Convert a model, and the models nested in it, to compact resources.
+
+    Args:
+        value (Any): A WooCommerceResource, or a WooCommerceCollection, which
+            is converted to a tuple of compact resources.
+
+    Returns:
+        Any: The compact resource, or tuple of compact resources.
+
+    """
+    if isinstance(value, wc_collections.WooCommerceCollection):
+        return tuple(to_compact(item) for item in value.root)
+    if isinstance(value, BaseModel):
+        model = type(value)
+        compact = object.__new__(compact_class(model))
+        fields = model.model_fields
+        for name in value.model_fields_set:
+            field_value = getattr(value, name)
+            if field_value is not None or fields[name].default is not None:
+                _object_setattr(compact, name, to_compact(field_value))
+        return compact
+    if isinstance(value, list):
+        return tuple(to_compact(item) for item in value)
+    return value
+
+
+def from_compact(
+    value: Any,  # noqa: ANN401
+    collection: type[wc_collections.WooCommerceCollection] | None = None,
+) -> Any:  # noqa: ANN401
+    """
+    Convert compact resources back to models.
+
+    Args:
+        value (Any): A compact resource, or a sequence of compact resources.
+        collection (type[WooCommerceCollection] | None): Collection model to
+            wrap a sequence of resources in, eg ShopOrderList.
+
+    Returns:
+        Any: The model instance, or a list of instances or the collection.
+
+    """
+    if isinstance(value, CompactResource):
+        values = {name: _from_compact(item) for name, item in value._items()}  # noqa: SLF001
+        return value._model.model_construct(**values)  # noqa: SLF001
+    items = [from_compact(item) for item in value]
+    return collection.model_construct(items) if collection is not None else items
+
+
+def _from_compact(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, CompactResource):
+        return from_compact(value)
+    if isinstance(value, tuple):
+        return [_from_compact(item) for item in value]
+    return value
+
+
+def _unpickle(model: type[BaseModel], values: dict[str, Any]) -> CompactResource:
+    compact = object.__new__(compact_class(model))
+    for name, value in values.items():
+        _object_setattr(compact, name, value)
+    return compact
+
@@ -0,0 +1,130 @@
+"""
+Construction of response models from trusted data, without validation.
+
+`construct()` builds a model from already conforming JSON data, such as a
+replay from an archive, instantiating nested models, enums and URLs the
+way validation would but without running any validators. Invalid data is not
+detected and may produce models that do not match their annotations.
+"""
+from __future__ import annotations
+
+import types
+from collections.abc import Callable
+from enum import Enum
+from functools import cache
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import AnyUrl, BaseModel, ValidationError
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+# Origins of Union annotations, and of `X | Y` ones from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+Converter = Callable[[Any], Any]
+
+_object_setattr = object.__setattr__
+
+
+def construct(model: type[BaseModel], data: Any) -> BaseModel:  # noqa: ANN401
+    """
+    Build a model instance from trusted JSON data without validating it.
+
+    Args:
+        model (type[BaseModel]): A WooCommerceResource or WooCommerceCollection model.
+        data (Any): Decoded JSON data, eg a dict for a resource or a list for a collection.
+
+    Returns:
+        BaseModel: The model instance, including nested models and enums.
+
+    """
+    if issubclass(model, wc_collections.WooCommerceCollection):
+        item_converter = _converter(model.item_model())
+        return model.model_construct([item_converter(item) for item in data])
+    return _model_converter(model)(data)
+
+
+@cache
+def _model_converter(model: type[BaseModel]) -> Converter:
+    """Return a function building `model` from a dict, compiled once per model."""
+    fields = []
+    defaults = {}
+    for name, field_info in model.model_fields.items():
+        converter = _annotation_converter(field_info.annotation)
+        fields.append((field_info.alias or name, name, converter))
+        if field_info.default_factory is None and not field_info.is_required():
+            defaults[name] = field_info.default
+
+    def convert(data: dict) -> BaseModel:
+        values = {}
+        for key, name, converter in fields:
+            if key in data:
+                value = data[key]
+                values[name] = value if converter is None or value is None else converter(value)
+        if len(defaults) == len(fields):
+            # Equivalent to model_construct(), without its per call field introspection
+            instance = model.__new__(model)
+            _object_setattr(instance, "__dict__", {**defaults, **values})
+            _object_setattr(instance, "__pydantic_fields_set__", set(values))
+            _object_setattr(instance, "__pydantic_extra__", None)
+            _object_setattr(instance, "__pydantic_private__", None)
+            return instance
+        return model.model_construct(_fields_set=set(values), **values)
+
+    return convert
+
+
+def _converter(annotation: Any) -> Converter:  # noqa: ANN401
+    return _annotation_converter(annotation) or (lambda value: value)
+
+
+def _annotation_converter(annotation: Any) -> Converter | None:  # noqa: ANN401, PLR0911
+    """Return a function converting JSON data to `annotation`, or None if it needs no conversion."""
+    if isinstance(annotation, type):
+        return _type_converter(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_ORIGINS:
+        converters = [(arg, _annotation_converter(arg)) for arg in args if arg is not type(None)]
+        converters = [(arg, converter) for arg, converter in converters if converter is not None]
+        if not converters:
+            return None
+        if len(converters) == 1:
+            arg, converter = converters[0]
+            # Only convert values of the matching JSON type, eg dicts for a model
+            if isinstance(arg, type) and issubclass(arg, BaseModel):
+                return lambda value: converter(value) if isinstance(value, dict) else value
+            return converter
+        return None
+    if origin is list and args and (item_converter := _annotation_converter(args[0])):
+        return lambda value: [item_converter(item) for item in value]
+    if origin is dict and len(args) == 2 and (value_converter := _annotation_converter(args[1])):  # noqa: PLR2004
+        return lambda value: {key: value_converter(item) for key, item in value.items()}
+    return None
+
+
+def _type_converter(annotation: type) -> Converter | None:
+    if issubclass(annotation, BaseModel):
+        return _model_converter(annotation)
+    if issubclass(annotation, Enum):
+        return _enum_converter(annotation)
+    if issubclass(annotation, AnyUrl):
+        return _url_converter(annotation)
+    return None
+
+
+def _enum_converter(enum: type[Enum]) -> Converter:
+    members = {member.value: member for member in enum}
+    return lambda value: members.get(value, value)
+
+
+def _url_converter(url_type: type[AnyUrl]) -> Converter:
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        try:
+            return url_type(value)
+        except ValidationError:
+            # Left as is, as construction does not detect invalid data
+            return value
+
+    return convert
@@ -1,7 +1,17 @@
-"""Maps HTTP GET endpoints to their corresponding response models."""
-from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
-from urllib.parse import urlparse
+"""
+Maps HTTP endpoints, per verb, to their corresponding response models.
+
+`RESPONSE_MODELS` is compiled once into a segment trie per HTTP verb, which
+is used to resolve request URLs to a model and the path parameters.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import parse_qs, urlsplit
 
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
 
 RESPONSE_MODELS = {
     "get": {
@@ -67,141 +77,209 @@ RESPONSE_MODELS = {
         "/data/currencies/current": wc_resources.DataCurrencies,
         "/data/currencies/{currency}": wc_resources.DataCurrencies,
     },
+    "post": {
+        "/coupons": wc_resources.ShopCoupon,
+        "/coupons/{id}": wc_resources.ShopCoupon,
+        "/customers": wc_resources.Customer,
+        "/customers/{id}": wc_resources.Customer,
+        "/orders/{order_id}/notes": wc_resources.OrderNote,
+        "/orders/{order_id}/refunds": wc_resources.ShopOrderRefund,
+        "/orders": wc_resources.ShopOrder,
+        "/orders/{id}": wc_resources.ShopOrder,
+        "/products/attributes/{attribute_id}/terms": wc_resources.ProductAttributeTerm,
+        "/products/attributes/{attribute_id}/terms/{id}": wc_resources.ProductAttributeTerm,
+        "/products/attributes": wc_resources.ProductAttribute,
+        "/products/attributes/{id}": wc_resources.ProductAttribute,
+        "/products/categories": wc_resources.ProductCat,
+        "/products/categories/{id}": wc_resources.ProductCat,
+        "/products/reviews": wc_resources.ProductReview,
+        "/products/reviews/{id}": wc_resources.ProductReview,
+        "/products/shipping_classes": wc_resources.ProductShippingClass,
+        "/products/shipping_classes/{id}": wc_resources.ProductShippingClass,
+        "/products/tags": wc_resources.ProductTag,
+        "/products/tags/{id}": wc_resources.ProductTag,
+        "/products": wc_resources.Product,
+        "/products/{id}": wc_resources.Product,
+        "/products/{product_id}/variations": wc_resources.ProductVariation,
+        "/products/{product_id}/variations/{id}": wc_resources.ProductVariation,
+        "/shipping/zones": wc_resources.ShippingZone,
+        "/shipping/zones/{id}": wc_resources.ShippingZone,
+        "/shipping/zones/{id}/locations": wc_collections.ShippingZoneLocationList,
+        "/shipping/zones/{zone_id}/methods": wc_resources.ShippingZoneMethod,
+        "/shipping/zones/{zone_id}/methods/{instance_id}": wc_resources.ShippingZoneMethod,
+        "/taxes/classes": wc_resources.TaxClass,
+        "/taxes": wc_resources.Tax,
+        "/taxes/{id}": wc_resources.Tax,
+        "/webhooks": wc_resources.Webhook,
+        "/webhooks/{id}": wc_resources.Webhook,
+        "/system_status/tools/{id}": wc_resources.SystemStatusTool,
+        "/payment_gateways/{id}": wc_resources.PaymentGateway,
+    },
+    "put": {
+        "/coupons/{id}": wc_resources.ShopCoupon,
+        "/customers/{id}": wc_resources.Customer,
+        "/orders/{id}": wc_resources.ShopOrder,
+        "/products/attributes/{attribute_id}/terms/{id}": wc_resources.ProductAttributeTerm,
+        "/products/attributes/{id}": wc_resources.ProductAttribute,
+        "/products/categories/{id}": wc_resources.ProductCat,
+        "/products/reviews/{id}": wc_resources.ProductReview,
+        "/products/shipping_classes/{id}": wc_resources.ProductShippingClass,
+        "/products/tags/{id}": wc_resources.ProductTag,
+        "/products/{id}": wc_resources.Product,
+        "/products/{product_id}/variations/{id}": wc_resources.ProductVariation,
+        "/shipping/zones/{id}": wc_resources.ShippingZone,
+        "/shipping/zones/{id}/locations": wc_collections.ShippingZoneLocationList,
+        "/shipping/zones/{zone_id}/methods/{instance_id}": wc_resources.ShippingZoneMethod,
+        "/taxes/{id}": wc_resources.Tax,
+        "/webhooks/{id}": wc_resources.Webhook,
+        "/system_status/tools/{id}": wc_resources.SystemStatusTool,
+        "/payment_gateways/{id}": wc_resources.PaymentGateway,
+    },
+    # Deleted resources, as returned with or without `force`
+    "delete": {
+        "/coupons/{id}": wc_resources.ShopCoupon,
+        "/customers/{id}": wc_resources.Customer,
+        "/orders/{order_id}/notes/{id}": wc_resources.OrderNote,
+        "/orders/{order_id}/refunds/{id}": wc_resources.ShopOrderRefund,
+        "/orders/{id}": wc_resources.ShopOrder,
+        "/products/attributes/{attribute_id}/terms/{id}": wc_resources.ProductAttributeTerm,
+        "/products/attributes/{id}": wc_resources.ProductAttribute,
+        "/products/categories/{id}": wc_resources.ProductCat,
+        "/products/reviews/{id}": wc_resources.ProductReview,
+        "/products/shipping_classes/{id}": wc_resources.ProductShippingClass,
+        "/products/tags/{id}": wc_resources.ProductTag,
+        "/products/{id}": wc_resources.Product,
+        "/products/{product_id}/variations/{id}": wc_resources.ProductVariation,
+        "/shipping/zones/{id}": wc_resources.ShippingZone,
+        "/shipping/zones/{zone_id}/methods/{instance_id}": wc_resources.ShippingZoneMethod,
+        "/taxes/classes/{slug}": wc_resources.TaxClass,
+        "/taxes/{id}": wc_resources.Tax,
+        "/webhooks/{id}": wc_resources.Webhook,
+    },
 }
 
-def get_endpoint_components(url) -> list[str]:
-    parsed_url = urlparse(url)
-    path = parsed_url.path
-    # Remove leading slash
-    path = path.lstrip("/")
-    components = path.split("/")
-    # remove wp-json/wc/v3
-    return components[3:]
-
-def get_endpoint_model(url):
-    parts = get_endpoint_components(url)
-    match parts:
-        case ["coupons"]:
-            return wc_collections.ShopCouponList
-        case ["coupons", id]:
-            return wc_resources.ShopCoupon
-        case ["customers", customer_id, "downloads"]:
-            return wc_collections.CustomerDownloadList
-        case ["customers"]:
-            return wc_collections.CustomerList
-        case ["customers", id]:
-            return wc_resources.Customer
-        case ["orders", order_id, "notes"]:
-            return wc_collections.OrderNoteList
-        case ["orders", order_id, "notes", id]:
-            return wc_resources.OrderNote
-        case ["orders", order_id, "refunds"]:
-            return wc_collections.ShopOrderRefundList
-        case ["orders", order_id, "refunds", id]:
-            return wc_resources.ShopOrderRefund
-        case ["orders"]:
-            return wc_collections.ShopOrderList
-        case ["orders", id]:
-            return wc_resources.ShopOrder
-        case ["products", "attributes", attribute_id, "terms"]:
-            return wc_collections.ProductAttributeTermList
-        case ["products", "attributes", attribute_id, "terms", id]:
-            return wc_resources.ProductAttributeTerm
-        case ["products", "attributes"]:
-            return wc_collections.ProductAttributeList
-        case ["products", "attributes", id]:
-            return wc_resources.ProductAttribute
-        case ["products", "categories"]:
-            return wc_collections.ProductCatList
-        case ["products", "categories", id]:
-            return wc_resources.ProductCat
-        case ["products", "reviews"]:
-            return wc_collections.ProductReviewList
-        case ["products", "reviews", id]:
-            return wc_resources.ProductReview
-        case ["products", "shipping_classes"]:
-            return wc_collections.ProductShippingClassList
-        case ["products", "shipping_classes", id]:
-            return wc_resources.ProductShippingClass
-        case ["products", "tags"]:
-            return wc_collections.ProductTagList
-        case ["products", "tags", id]:
-            return wc_resources.ProductTag
-        case ["products"]:
-            return wc_collections.ProductList
-        case ["products", id]:
-            return wc_resources.Product
-        case ["products", product_id, "variations"]:
-            return wc_collections.ProductVariationList
-        case ["products", product_id, "variations", id]:
-            return wc_resources.ProductVariation
-        case ["reports", "sales"]:
-            return wc_collections.SalesReportList
-        case ["reports", "top_sellers"]:
-            return wc_collections.TopSellersReportList
-        case ["reports", "orders", "totals"]:
-            return wc_collections.ReportOrderTotalList
-        case ["reports", "products", "totals"]:
-            return wc_collections.ReportProductTotalList
-        case ["reports", "customers", "totals"]:
-            return wc_collections.ReportCustomerTotalList
-        case ["reports", "coupons", "totals"]:
-            return wc_collections.ReportCouponTotalList
-        case ["reports", "reviews", "totals"]:
-            return wc_collections.ReportReviewTotalList
-        case ["reports"]:
-            return wc_collections.ReportList
-        case ["shipping", "zones"]:
-            return wc_collections.ShippingZoneList
-        case ["shipping", "zones", id]:
-            return wc_resources.ShippingZone
-        case ["shipping", "zones", id, "locations"]:
-            return wc_collections.ShippingZoneLocationList
-        case ["shipping", "zones", zone_id, "methods"]:
-            return wc_collections.ShippingZoneMethodList
-        case ["shipping", "zones", zone_id, "methods", instance_id]:
-            return wc_resources.ShippingZoneMethod
-        case ["taxes", "classes"]:
-            return wc_collections.TaxClassList
-        case ["taxes", "classes", slug]:
-            return wc_resources.TaxClass
-        case ["taxes"]:
-            return wc_collections.TaxList
-        case ["taxes", id]:
-            return wc_resources.Tax
-        case ["webhooks"]:
-            return wc_collections.WebhookList
-        case ["webhooks", id]:
-            return wc_resources.Webhook
-        case ["system_status"]:
-            return wc_resources.SystemStatus
-        case ["system_status", "tools"]:
-            return wc_collections.SystemStatusToolList
-        case ["system_status", "tools", id]:
-            return wc_resources.SystemStatusTool
-        case ["shipping_methods"]:
-            return wc_collections.ShippingMethodList
-        case ["shipping_methods", id]:
-            return wc_resources.ShippingMethod
-        case ["payment_gateways"]:
-            return wc_collections.PaymentGatewayList
-        case ["payment_gateways", id]:
-            return wc_resources.PaymentGateway
-        case ["data"]:
-            return wc_resources.DataIndex
-        case ["data", "continents"]:
-            return wc_collections.DataContinentsList
-        case ["data", "continents", location]:
-            return wc_resources.DataContinents
-        case ["data", "countries"]:
-            return wc_collections.DataCountriesList
-        case ["data", "countries", location]:
-            return wc_resources.DataCountries
-        case ["data", "currencies"]:
-            return wc_collections.DataCurrenciesList
-        case ["data", "currencies", "current"]:
-            return wc_resources.DataCurrencies
-        case ["data", "currencies", currency]:
-            return wc_resources.DataCurrencies
-        case _:
-            return None
+# Namespace of the WooCommerce REST API within a WordPress REST route, eg "wc/v3"
+API_VERSION_PATTERN = re.compile(r"v\d+")
+
+# Literal segments of unmapped endpoints, which must not be taken for a path
+# parameter, eg "products/batch" is not the product with id "batch"
+RESERVED_SEGMENTS = frozenset({"batch"})
+
+
+class EndpointMatch(NamedTuple):
+    """A request path resolved to its endpoint."""
+
+    model: type
+    template: str
+    params: dict[str, str]
+
+
+class _RouteNode:
+    """Node of the endpoint trie, one per path segment."""
+
+    __slots__ = ("children", "param", "route")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouteNode] = {}
+        self.param: _RouteNode | None = None
+        # (model, template, parameter names) of the endpoint ending at this node
+        self.route: tuple[type, str, tuple[str, ...]] | None = None
+
+
+def _compile_routes(routes: dict[str, type]) -> _RouteNode:
+    """Compile path templates, eg "/orders/{order_id}/notes", into a segment trie."""
+    root = _RouteNode()
+    for template, model in routes.items():
+        node = root
+        param_names = []
+        for segment in template.strip("/").split("/"):
+            if segment.startswith("{") and segment.endswith("}"):
+                param_names.append(segment[1:-1])
+                node.param = node.param or _RouteNode()
+                node = node.param
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+        node.route = (model, template, tuple(param_names))
+    return root
+
+
+ROUTERS = {verb: _compile_routes(routes) for verb, routes in RESPONSE_MODELS.items()}
+
+
+def _match_route(
+    node: _RouteNode,
+    segments: tuple[str, ...],
+    values: tuple[str, ...] = (),
+) -> tuple[tuple[type, str, tuple[str, ...]], tuple[str, ...]] | None:
+    """Walk the trie, preferring literal segments over parameters, and never binding reserved segments."""
+    if not segments:
+        return (node.route, values) if node.route else None
+    segment, rest = segments[0], segments[1:]
+    if (child := node.children.get(segment)) and (found := _match_route(child, rest, values)):
+        return found
+    if node.param and segment not in RESERVED_SEGMENTS:
+        return _match_route(node.param, rest, (*values, segment))
+    return None
+
+
+def get_endpoint_components(url: str) -> list[str]:
+    """
+    Return the endpoint path segments of a WooCommerce REST API url.
+
+    The API prefix is detected wherever it is, so WordPress installs in a
+    subdirectory ("/shop/wp-json/wc/v3/orders"), the legacy "wc-api/v3" prefix
+    and the plain "?rest_route=/wc/v3/orders" form all give ["orders"].
+    """
+    parsed_url = urlsplit(url)
+    if rest_route := parse_qs(parsed_url.query).get("rest_route"):
+        return _strip_api_prefix(["wp-json", *rest_route[0].split("/")])
+    return _strip_api_prefix(parsed_url.path.split("/"))
+
+
+def _strip_api_prefix(components: list[str]) -> list[str]:
+    components = [component for component in components if component]
+    for index, component in enumerate(components):
+        namespace = components[index + 1 : index + 3]
+        if (
+            component == "wp-json"
+            and len(namespace) == 2  # noqa: PLR2004
+            and namespace[0] == "wc"
+            and API_VERSION_PATTERN.fullmatch(namespace[1])
+        ):
+            return components[index + 3 :]
+        if component == "wc-api" and namespace and API_VERSION_PATTERN.fullmatch(namespace[0]):
+            return components[index + 2 :]
+    return []
+
+
+@lru_cache(maxsize=4096)
+def _resolve_components(verb: str, components: tuple[str, ...]) -> EndpointMatch | None:
+    if not components or (router := ROUTERS.get(verb)) is None:
+        return None
+    if (found := _match_route(router, components)) is None:
+        return None
+    (model, template, param_names), values = found
+    return EndpointMatch(model, template, dict(zip(param_names, values)))
+
+
+def resolve_endpoint(url: str, verb: str = "get") -> EndpointMatch | None:
+    """
+    Resolve a request url to its response model, path template and path parameters.
+
+    Args:
+        url (str): Request url, eg "https://example.com/wp-json/wc/v3/orders/12/notes".
+        verb (str): HTTP verb of the request.
+
+    Returns:
+        EndpointMatch | None: The matched endpoint, or None if no model is mapped.
+
+    """
+    match = _resolve_components(verb.lower(), tuple(get_endpoint_components(url)))
+    # Copy the params so callers cannot alter the cached match
+    return match._replace(params=dict(match.params)) if match else None
+
+
+def get_endpoint_model(url: str, verb: str = "get") -> type | None:
+    """Return the response model for a request url, or None if no model is mapped."""
+    match = _resolve_components(verb.lower(), tuple(get_endpoint_components(url)))
+    return match.model if match else None
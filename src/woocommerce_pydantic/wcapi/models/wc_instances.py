@@ -0,0 +1,116 @@
+"""
+Cache of validated resources, keyed by model, id, modification time and build mode.
+
+Polling the same collection often returns mostly unchanged objects. With an
+`InstanceCache` passed to the API as `instance_cache`, `data()` reuses the
+instance validated earlier for any item whose `id` and `date_modified_gmt`
+are unchanged, and only validates new or modified items. Instances built in
+trusted mode, without validation, are cached apart from validated instances,
+so they are never returned to a validating `data()` call.
+
+Cached instances are shared between responses, so they should not be mutated.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+# (model, id, date_modified_gmt, trusted)
+InstanceKey = tuple[type, Any, Any, bool]
+
+
+class InstanceCache:
+    """
+    Bounded LRU cache of validated resources.
+
+    Args:
+        maxsize (int): Maximum number of cached instances.
+
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._instances: OrderedDict[InstanceKey, BaseModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get_or_build(
+        self,
+        model: type[BaseModel],
+        data: Any,  # noqa: ANN401
+        build: Callable[[Any], BaseModel],
+        *,
+        trusted: bool = False,
+    ) -> BaseModel:
+        """
+        Return the cached instance for an item, or build and cache it.
+
+        Args:
+            model (type[BaseModel]): The resource model, eg ShopOrder.
+            data (Any): The decoded JSON item.
+            build (Callable[[Any], BaseModel]): Builds the instance from the item on a miss.
+            trusted (bool): Whether `build` skips validation.
+
+        Returns:
+            BaseModel: The instance for the item.
+
+        """
+        if not isinstance(data, dict) or data.get("id") is None or data.get("date_modified_gmt") is None:
+            return build(data)
+        key = (model, data["id"], data["date_modified_gmt"], trusted)
+        with self._lock:
+            if (instance := self._instances.get(key)) is not None:
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return instance
+        instance = build(data)
+        with self._lock:
+            self.misses += 1
+            self._instances[key] = instance
+            while len(self._instances) > self.maxsize:
+                self._instances.popitem(last=False)
+        return instance
+
+    def build(
+        self,
+        model: type[BaseModel],
+        data: Any,  # noqa: ANN401
+        build: Callable[[type, Any], BaseModel],
+        *,
+        trusted: bool = False,
+    ) -> BaseModel:
+        """
+        Build a resource or collection, reusing cached instances of unchanged items.
+
+        Args:
+            model (type[BaseModel]): A WooCommerceResource or WooCommerceCollection model.
+            data (Any): The decoded JSON data.
+            build (Callable[[type, Any], BaseModel]): Builds a resource from a model and an item.
+            trusted (bool): Whether `build` skips validation.
+
+        Returns:
+            BaseModel: The resource or collection.
+
+        """
+        if issubclass(model, wc_collections.WooCommerceCollection):
+            item_model = model.item_model()
+            items = [
+                self.get_or_build(item_model, item, lambda item: build(item_model, item), trusted=trusted)
+                for item in data
+            ]
+            return model.model_construct(items)
+        return self.get_or_build(model, data, lambda item: build(model, item), trusted=trusted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
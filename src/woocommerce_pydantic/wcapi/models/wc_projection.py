@@ -0,0 +1,89 @@
+"""
+Projected response models for requests made with the `_fields` parameter.
+
+A projection of a model keeps only the requested fields, following nested
+paths such as "billing.email" into the nested models. Projections are
+generated on demand and cached, so each distinct field selection builds
+its model once.
+"""
+from __future__ import annotations
+
+import types
+from functools import lru_cache
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, create_model
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+
+# Origins of Union annotations, and of `X | Y` ones from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+def project_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """
+    Return a model containing only the given fields of a response model.
+
+    Args:
+        model (type[BaseModel]): A WooCommerceResource or WooCommerceCollection model.
+        fields (tuple[str, ...]): Field names as sent in `_fields`, eg ("id", "billing.email").
+
+    Returns:
+        type[BaseModel]: The projected model, cached per model and field selection.
+
+    """
+    return _project_model(model, tuple(sorted(set(fields))))
+
+
+@lru_cache(maxsize=256)
+def _project_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    if issubclass(model, wc_collections.WooCommerceCollection):
+        item_model = _project_model(model.item_model(), fields)
+        return create_model(
+            f"{model.__name__}Projection",
+            __base__=wc_collections.WooCommerceCollection[list[item_model]],
+            __module__=model.__module__,
+        )
+
+    # Group nested paths under their top level field, eg {"billing": {"email"}}
+    requested: dict[str, set[str]] = {}
+    for path in fields:
+        name, _, subpath = path.partition(".")
+        requested.setdefault(name, set())
+        if subpath:
+            requested[name].add(subpath)
+
+    field_definitions = {}
+    for name, field_info in model.model_fields.items():
+        key = field_info.alias or name
+        if key not in requested:
+            continue
+        annotation = field_info.annotation
+        subpaths = requested[key]
+        # A bare top level name selects the whole field, as in `_fields`
+        if subpaths and key not in fields:
+            annotation = _project_annotation(annotation, tuple(sorted(subpaths)))
+        field_definitions[name] = (
+            annotation,
+            Field(field_info.default, alias=field_info.alias, description=field_info.description),
+        )
+
+    return create_model(
+        f"{model.__name__}Projection",
+        __base__=wc_resources.WooCommerceResource,
+        __module__=model.__module__,
+        **field_definitions,
+    )
+
+
+def _project_annotation(annotation: Any, fields: tuple[str, ...]) -> Any:  # noqa: ANN401
+    """Replace the models nested in an annotation, eg `list[LineItem] | None`, with projections."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _project_model(annotation, fields)
+    if not (args := get_args(annotation)):
+        return annotation
+    projected_args = tuple(_project_annotation(arg, fields) for arg in args)
+    origin = get_origin(annotation)
+    if origin in _UNION_ORIGINS:
+        return Union[projected_args]
+    return origin[projected_args]
@@ -11,11 +11,12 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-from pydantic import AnyUrl, BaseModel, EmailStr, Field
+from pydantic import AnyUrl, BaseModel, ConfigDict, EmailStr, Field
 
 
 class WooCommerceResource(BaseModel):
-    pass
+    # Build validators and serializers on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
 
 class DiscountType(Enum):
     percent = "percent"
@@ -0,0 +1,50 @@
+"""
+Registry of compiled validators for the endpoint response models.
+
+Each model gets one `TypeAdapter`, built on first use (or eagerly with
+`warm()`) and reused for every response. Collections can also be validated
+to a plain `list` of items, skipping the RootModel wrapper.
+"""
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_endpoints
+
+_VALIDATORS: dict[tuple[type, bool], TypeAdapter] = {}
+
+
+def get_validator(model: type, *, plain: bool = False) -> TypeAdapter:
+    """
+    Return the cached validator for a response model.
+
+    Args:
+        model (type): A WooCommerceResource or WooCommerceCollection model.
+        plain (bool): For collections, validate to `list[item_model]` rather
+            than to the collection model, eg `list[ShopOrder]` for ShopOrderList.
+
+    Returns:
+        TypeAdapter: The validator for the model.
+
+    """
+    plain = plain and issubclass(model, wc_collections.WooCommerceCollection)
+    if (validator := _VALIDATORS.get((model, plain))) is None:
+        validator = TypeAdapter(list[model.item_model()] if plain else model)
+        # Concurrent first uses may both build a validator, only one is kept
+        validator = _VALIDATORS.setdefault((model, plain), validator)
+    return validator
+
+
+def warm(*, plain: bool = False) -> None:
+    """
+    Build the validators of every endpoint model up front.
+
+    Args:
+        plain (bool): Also build the plain list validators of collections.
+
+    """
+    for routes in wc_endpoints.RESPONSE_MODELS.values():
+        for model in routes.values():
+            get_validator(model)
+            if plain:
+                get_validator(model, plain=True)
@@ -1,14 +1,181 @@
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from json import dumps as jsonencode
+from time import monotonic
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlencode, urlparse
 
-from requests import Response
+from pydantic import BaseModel
+from pydantic_core import from_json
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from woocommerce import API as woocommmerce_api
 
-from woocommerce_pydantic.wcapi.models import wc_collections, wc_endpoints, wc_resources
+from woocommerce_pydantic.wcapi import models, wc_cache, wc_ratelimit, wc_singleflight
 
+if TYPE_CHECKING:
+    from woocommerce_pydantic.wcapi.models import wc_collections, wc_endpoints, wc_resources
 
-class WooDataResponse(Response):
+
+class WooDataMixin:
+    """
+    Adds the data() method to an HTTP response.
+
+    Expects the response to provide `url`, `headers`, `links`, `content` and
+    `json()`, as both `requests.Response` and `httpx.Response` do.
+    """
+
+    # Build models without validation, set from the API's `trusted` option
+    trusted = False
+    # Entry of a cache storing models, which keeps the first data() result
+    cache_entry: wc_cache.CacheEntry | None = None
+    # Cache of validated items, set from the API's `instance_cache` option
+    instance_cache = None
+    # data() results by options, set on responses shared by coalesced requests
+    shared_data: dict | None = None
+    shared_data_lock: threading.Lock | None = None
+
+    def get_endpoint_components(self, url) -> list[str]:
+        return models.wc_endpoints.get_endpoint_components(url)
+
+    def get_verb(self) -> str:
+        """Return the HTTP verb of the request, "get" for responses rebuilt from a cache."""
+        request = getattr(self, "request", None)
+        return request.method.lower() if request is not None else "get"
+
+    def get_endpoint_match(self) -> wc_endpoints.EndpointMatch | None:
+        return models.wc_endpoints.resolve_endpoint(self.url, self.get_verb())
+
+    def get_pydantic_model(self) -> type | None:
+        model = models.wc_endpoints.get_endpoint_model(self.url, self.get_verb())
+        if model and (fields := self.get_requested_fields()):
+            return models.wc_projection.project_model(model, fields)
+        return model
+
+    def get_requested_fields(self) -> tuple[str, ...]:
+        """Return the fields requested with the `_fields` query parameter, if any."""
+        fields = parse_qs(urlparse(self.url).query).get("_fields", [])
+        return tuple(field for value in fields for field in value.split(",") if field)
+
+    def next_page(self, page: int) -> int | None:
+        """
+        Return the number of the page following `page`, if there is one.
+
+        Uses the `X-WP-TotalPages` header when present, falling back to the
+        `rel="next"` entry of the `Link` header.
+
+        Args:
+            page (int): The page number this response was requested with.
+
+        Returns:
+            int | None: The next page number, or None on the last page.
+
+        """
+        total_pages = self.headers.get("X-WP-TotalPages")
+        if total_pages is not None:
+            return page + 1 if page < int(total_pages) else None
+        if next_link := self.links.get("next"):
+            next_page = parse_qs(urlparse(next_link["url"]).query).get("page")
+            return int(next_page[0]) if next_page else page + 1
+        return None
+
+    def data(
+        self,
+        *,
+        plain: bool = False,
+        lazy: bool = False,
+        trusted: bool | None = None,
+    ) -> list[object] | object:
+        """
+        Return data validated as Pydantic model(s).
+
+        Maps JSON data from the API response to a Pydantic model.
+
+        Args:
+            plain (bool): Return a list of items, eg `list[ShopOrder]`, rather
+                than the collection model for collection endpoints.
+            lazy (bool): Return a `wc_collections.LazyCollection` for collection
+                endpoints, which validates each item only when it is accessed.
+            trusted (bool | None): Build the models without validation, see
+                `wc_construct.construct()`. Defaults to the API's `trusted` option.
+
+        With the API's `instance_cache` option, unchanged items are reused from
+        the `wc_instances.InstanceCache`. Responses from a `MemoryCache` storing
+        models return the cached models, whatever the options. Responses shared
+        by coalesced requests compute `data()` once for each set of options.
+
+        Returns:
+            list[object] | object: Pydantic model instance(s) with JSON data.
+
+        Raises:
+            ValueError: If the endpoint cannot be mapped to a Pydantic model.
+
+        """
+        if self.shared_data is not None:
+            key = (plain, lazy, trusted)
+            with self.shared_data_lock:
+                if key not in self.shared_data:
+                    self.shared_data[key] = self._data(plain=plain, lazy=lazy, trusted=trusted)
+                return self.shared_data[key]
+        return self._data(plain=plain, lazy=lazy, trusted=trusted)
+
+    def _data(self, *, plain: bool, lazy: bool, trusted: bool | None) -> list[object] | object:
+        if self.cache_entry is not None:
+            if self.cache_entry.data is None:
+                self.cache_entry.data = self._build_data(plain=False, lazy=False, trusted=None)
+            if plain and isinstance(self.cache_entry.data, models.wc_collections.WooCommerceCollection):
+                return self.cache_entry.data.root
+            return self.cache_entry.data
+        return self._build_data(plain=plain, lazy=lazy, trusted=trusted)
+
+    def _build_data(self, *, plain: bool, lazy: bool, trusted: bool | None) -> list[object] | object:
+        if model := self.get_pydantic_model():
+            is_collection = issubclass(model, models.wc_collections.WooCommerceCollection)
+            if lazy and is_collection:
+                return models.wc_collections.LazyCollection(model, from_json(self.content))
+            trusted = self.trusted if trusted is None else trusted
+            if self.instance_cache is not None:
+                build = models.wc_construct.construct if trusted else _validate_python
+                data = self.instance_cache.build(model, from_json(self.content), build, trusted=trusted)
+                return data.root if plain and is_collection else data
+            if trusted:
+                data = models.wc_construct.construct(model, from_json(self.content))
+                return data.root if plain and is_collection else data
+            # Validate the raw body in a single pass with pydantic-core's JSON parser
+            return models.wc_validators.get_validator(model, plain=plain).validate_json(self.content)
+        msg = f"Failed to map the WooCommerce API endpoint '{self.url}' to a Pydantic model."
+        raise ValueError(msg)
+
+
+def unseen_items(
+    items: Iterable[wc_resources.WooCommerceResource],
+    seen_ids: set,
+) -> Iterator[wc_resources.WooCommerceResource]:
+    """
+    Yield the items whose `id` is not in `seen_ids`, adding their ids to it.
+
+    Items without an `id` are always yielded.
+    """
+    for item in items:
+        item_id = getattr(item, "id", None)
+        if item_id is not None:
+            if item_id in seen_ids:
+                continue
+            seen_ids.add(item_id)
+        yield item
+
+
+def _validate_python(model: type, data: object) -> object:
+    return models.wc_validators.get_validator(model).validate_python(data)
+
+
+class WooDataResponse(WooDataMixin, Response):
     """Wraps the Response object to add a data() method."""
 
     def __new__(cls, original_response: Response) -> "WooDataResponse":
@@ -27,43 +194,476 @@ class WooDataResponse(Response):
     def __init__(self, original_response: Response) -> None:  # noqa: D107
         pass
 
-    def get_endpoint_components(self, url) -> list[str]:
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-        # Remove leading slash
-        path = path.lstrip("/")
-        components = path.split("/")
-        # remove wp-json/wc/v3
-        return components[3:]
+    def iter_data(
+        self,
+        chunk_size: int = 64 * 1024,
+        *,
+        trusted: bool | None = None,
+    ) -> Iterator[wc_resources.WooCommerceResource]:
+        """
+        Yield the items of a collection response, each validated as soon as it is read.
 
-    def get_pydantic_model(self) -> type | None:
-        return wc_endpoints.get_endpoint_model(self.url)
+        For a response requested with `stream=True`, the body is read in chunks
+        and only one item is held in memory at a time, rather than the whole
+        body, its parsed tree and the validated collection. See `wc_stream`.
+
+        Args:
+            chunk_size (int): Number of bytes read at a time.
+            trusted (bool | None): Build the items without validation, see
+                `wc_construct.construct()`. Defaults to the API's `trusted` option.
+
+        Yields:
+            WooCommerceResource: Each item, eg `wc_resources.Product`.
+
+        Raises:
+            ValueError: If the endpoint cannot be mapped to a collection model,
+                or the response is not a JSON array.
 
-    def data(self) -> list[object] | object:
         """
-        Return data validated as Pydantic model(s).
+        model = self.get_pydantic_model()
+        if model is None or not issubclass(model, models.wc_collections.WooCommerceCollection):
+            msg = f"Failed to map the WooCommerce API endpoint '{self.url}' to a collection model."
+            raise ValueError(msg)
+        from woocommerce_pydantic.wcapi import wc_stream  # noqa: PLC0415
 
-        Maps JSON data from the API response to a Pydantic model.
+        item_model = model.item_model()
+        trusted = self.trusted if trusted is None else trusted
+        for item in wc_stream.iter_array_items(self.iter_content(chunk_size)):
+            if trusted:
+                yield models.wc_construct.construct(item_model, from_json(item))
+            else:
+                yield item_model.model_validate_json(item)
 
-        Returns:
-            list[object] | object: Pydantic model instance(s) with JSON data.
+
+DEFAULT_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+class API(woocommmerce_api):
+    """
+    Extends the woocommerce API class to return a WooDataResponse object.
+
+    All requests share a pooled keep-alive `requests.Session`, configured with
+    the `pool_connections`, `pool_maxsize` and `max_retries` options. Use the
+    API as a context manager, or call `close()`, to release its connections.
+
+    With the `trusted` option, `data()` builds models without validation.
+    GET responses are cached by the `cache` option, see `wc_cache`, and
+    validated items by the `instance_cache` option, see `wc_instances`.
+    Requests are throttled by the `rate_limiter` option, see `wc_ratelimit`.
+    With the `coalesce` option, identical concurrent GETs share a single
+    request and response, see `wc_singleflight`.
+    """
+
+    def __init__(self, url: str, consumer_key: str, consumer_secret: str, **kwargs) -> None:
+        super().__init__(url, consumer_key, consumer_secret, **kwargs)
+        self.pool_connections = kwargs.get("pool_connections", 10)
+        self.pool_maxsize = kwargs.get("pool_maxsize", 10)
+        self.max_retries = kwargs.get("max_retries", DEFAULT_RETRIES)
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.session = kwargs.get("session") or self._create_session()
+        self.trusted = kwargs.get("trusted", False)
+        self.cache = kwargs.get("cache")
+        self.instance_cache = kwargs.get("instance_cache")
+        self.single_flight = wc_singleflight.SingleFlight() if kwargs.get("coalesce") else None
+
+    def __enter__(self) -> API:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections of the session."""
+        self.session.close()
+
+    def _create_session(self) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self._adapter_retries(),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _adapter_retries(self) -> Retry | int:
+        """Return the retries of the session adapter, leaving throttled responses to the rate limiter."""
+        if self.rate_limiter is None or not isinstance(self.max_retries, Retry):
+            return self.max_retries
+        status_forcelist = set(self.max_retries.status_forcelist or ()) - set(wc_ratelimit.THROTTLED_STATUS_CODES)
+        return self.max_retries.new(status_forcelist=status_forcelist, respect_retry_after_header=False)
+
+    def _throttled_attempts(self, method: str) -> int:
+        """Return how many times a request throttled by the server is sent through the rate limiter."""
+        retries = self.max_retries
+        if not isinstance(retries, Retry):
+            return 1
+        retried = set(retries.status_forcelist or ()) & set(wc_ratelimit.THROTTLED_STATUS_CODES)
+        if not retried or (retries.allowed_methods and method.upper() not in retries.allowed_methods):
+            return 1
+        limit = retries.status if isinstance(retries.status, int) else retries.total
+        return 1 + (limit if isinstance(limit, int) else 0)
+
+    # Both this class and woocommerce.API are named "API", so this method
+    # overrides the name-mangled woocommerce.API.__request used by every verb,
+    # while self.__get_url and self.__get_oauth_url resolve to the originals.
+    def __request(self, method: str, endpoint: str, data: object, params: dict | None = None, **kwargs) -> Response:
+        """Do requests through the pooled session."""
+        params = {} if params is None else params
+        url = self.__get_url(endpoint)
+        auth = None
+        headers = {
+            "user-agent": f"{self.user_agent}",
+            "accept": "application/json",
+        }
+
+        if self.is_ssl is True and self.query_string_auth is False:
+            auth = HTTPBasicAuth(self.consumer_key, self.consumer_secret)
+        elif self.is_ssl is True and self.query_string_auth is True:
+            params.update({"consumer_key": self.consumer_key, "consumer_secret": self.consumer_secret})
+        else:
+            url = self.__get_oauth_url(f"{url}?{urlencode(params)}", method, **kwargs)
+            # Signed into the url above
+            params = {}
+            kwargs.pop("oauth_timestamp", None)
+
+        if isinstance(data, BaseModel):
+            data = data.model_dump_json(by_alias=True, exclude_unset=True).encode("utf-8")
+            headers["content-type"] = "application/json;charset=utf-8"
+        elif data is not None:
+            data = jsonencode(data, ensure_ascii=False).encode("utf-8")
+            headers["content-type"] = "application/json;charset=utf-8"
+
+        send = partial(
+            self.session.request,
+            method=method,
+            url=url,
+            verify=self.verify_ssl,
+            auth=auth,
+            params=params,
+            data=data,
+            timeout=self.timeout,
+            headers=headers,
+            **kwargs,
+        )
+        if self.rate_limiter is None:
+            return send()
+
+        attempts = self._throttled_attempts(method)
+        while True:
+            self.rate_limiter.acquire()
+            started = monotonic()
+            try:
+                response = send()
+            except Exception:
+                self.rate_limiter.release(None, monotonic() - started)
+                raise
+            retry_after = response.headers.get("Retry-After")
+            self.rate_limiter.release(response.status_code, monotonic() - started, retry_after)
+            attempts -= 1
+            if response.status_code not in wc_ratelimit.THROTTLED_STATUS_CODES or attempts <= 0:
+                return response
+            # Retried once the limiter has backed off and waited for Retry-After
+            response.close()
+
+    def get_endpoint_model(self, endpoint: str, verb: str = "get") -> type | None:
+        """Return the response model of an endpoint of this API, eg ShopOrderList for "orders"."""
+        return models.wc_endpoints.get_endpoint_model(self.__get_url(endpoint.strip("/")), verb)
+
+    def get(self, endpoint: str, fields: Iterable[str] | None = None, **kwargs) -> WooDataResponse:
+        """
+        Get requests, returning a WooDataResponse.
+
+        Args:
+            endpoint (str): API endpoint, eg "orders".
+            fields (Iterable[str] | None): Only request these fields, sent as
+                `_fields`. Nested fields use dots, eg "billing.email". `data()`
+                then validates into a projection of the endpoint model.
+            **kwargs: Passed through to the woocommerce API.
+
+        """
+        if fields:
+            kwargs["params"] = {**(kwargs.get("params") or {}), "_fields": ",".join(fields)}
+        if self.cache is not None and not kwargs.get("stream"):
+            return self._get_cached(endpoint, **kwargs)
+        return self._get(endpoint, **kwargs)
+
+    def post(self, endpoint: str, data: BaseModel | dict, **kwargs) -> WooDataResponse:
+        """
+        POST requests, returning a WooDataResponse.
+
+        Args:
+            endpoint (str): API endpoint, eg "orders".
+            data (BaseModel | dict): Request body. Models are serialised directly
+                to JSON with only the fields that were set.
+            **kwargs: Passed through to the woocommerce API.
+
+        """
+        return self._wrap_response(super().post(endpoint, data, **kwargs))
+
+    def put(self, endpoint: str, data: BaseModel | dict, **kwargs) -> WooDataResponse:
+        """PUT requests, returning a WooDataResponse, see `post()`."""
+        return self._wrap_response(super().put(endpoint, data, **kwargs))
+
+    def delete(self, endpoint: str, *, force: bool = False, **kwargs) -> WooDataResponse:
+        """
+        DELETE requests, returning a WooDataResponse of the deleted resource.
+
+        Args:
+            endpoint (str): API endpoint, eg "orders/12".
+            force (bool): Delete permanently rather than moving to the trash.
+            **kwargs: Passed through to the woocommerce API.
+
+        """
+        if force:
+            kwargs["params"] = {**(kwargs.get("params") or {}), "force": "true"}
+        return self._wrap_response(super().delete(endpoint, **kwargs))
+
+    def options(self, endpoint: str, **kwargs) -> WooDataResponse:
+        """
+        OPTIONS requests, returning a WooDataResponse.
+
+        OPTIONS responses describe an endpoint's schema and are not modelled,
+        so their `data()` raises ValueError; use `json()` instead.
+        """
+        return self._wrap_response(super().options(endpoint, **kwargs))
+
+    def _wrap_response(self, original_response: Response) -> WooDataResponse:
+        """Wrap a response as a WooDataResponse configured with the API's options."""
+        response = WooDataResponse(original_response)
+        response.trusted = self.trusted
+        response.instance_cache = self.instance_cache
+        return response
+
+    def _get(self, endpoint: str, **kwargs) -> WooDataResponse:
+        # Only plain GETs are coalesced, as other options may change the response
+        if self.single_flight is not None and kwargs.keys() <= {"params"}:
+            query = urlencode(sorted((kwargs.get("params") or {}).items()), doseq=True)
+            key = f"{endpoint.strip('/')}?{query}"
+            return self.single_flight.do(key, partial(self._get_shared, endpoint, **kwargs))
+        return self._wrap_response(super().get(endpoint, **kwargs))
+
+    def _get_shared(self, endpoint: str, **kwargs) -> WooDataResponse:
+        """Send a GET whose response may be shared by coalesced requests."""
+        response = self._wrap_response(super().get(endpoint, **kwargs))
+        response.shared_data = {}
+        response.shared_data_lock = threading.Lock()
+        return response
+
+    def _get_cached(self, endpoint: str, **kwargs) -> WooDataResponse:
+        """Return the cached response to a GET request, or request and cache it."""
+        key = self.cache.make_key(endpoint, kwargs.get("params"), self.url, self.version)
+        if (entry := self.cache.get(key)) is not None:
+            response = self._wrap_response(entry.to_response())
+        else:
+            response = self._get(endpoint, **kwargs)
+            if response.status_code == 200 and (ttl := self.cache.ttl_for(response.url)) > 0:  # noqa: PLR2004
+                entry = wc_cache.CacheEntry.from_response(response)
+                self.cache.set(key, entry, ttl)
+        # Models are validated on the first data() call, so a get() never raises a ValidationError
+        if entry is not None and self.cache.store_models:
+            response.cache_entry = entry
+        return response
+
+    def _fetch_page(
+        self,
+        endpoint: str,
+        page: int,
+        params: dict | None,
+        per_page: int,
+        **kwargs,
+    ) -> tuple[wc_collections.WooCommerceCollection, WooDataResponse]:
+        """
+        Request a single page of a collection endpoint and validate it.
 
         Raises:
-            ValueError: If the endpoint cannot be mapped to a Pydantic model.
+            ValueError: If the endpoint does not map to a collection model.
+            requests.HTTPError: If the page request fails.
 
         """
-        if model := self.get_pydantic_model():
-            # Initialize pydantic model with the JSON data
-            if issubclass(model, wc_collections.WooCommerceCollection):
-                return model(self.json())
-            return model(**self.json())
-        msg = f"Failed to map the WooCommerce API endpoint '{self.url}' to a Pydantic model."
-        raise ValueError(msg)
+        response = self.get(endpoint, params={**(params or {}), "page": page, "per_page": per_page}, **kwargs)
+        response.raise_for_status()
+        collection = response.data()
+        if not isinstance(collection, models.wc_collections.WooCommerceCollection):
+            msg = f"WooCommerce API endpoint '{endpoint}' is not a collection endpoint."
+            raise ValueError(msg)  # noqa: TRY004
+        return collection, response
 
+    def iter_pages(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = 100,
+        workers: int = 1,
+        *,
+        ordered: bool = True,
+        start_page: int = 1,
+        **kwargs,
+    ) -> Iterator[wc_collections.WooCommerceCollection]:
+        """
+        Fetch a collection endpoint page by page, yielding each validated page.
 
-class API(woocommmerce_api):
-    """Extends the woocommerce API class to return a WooDataResponse object."""
+        With a single worker, pages are requested lazily, only once the previous
+        page has been consumed, so at most one page is held in memory at a time.
+
+        With several workers, the first page is fetched first to discover the
+        total page count from `X-WP-TotalPages`, then the following pages are
+        fetched concurrently on a thread pool, keeping at most two pages per
+        worker in flight.
+
+        Args:
+            endpoint (str): Collection endpoint, eg "orders".
+            params (dict | None): Query parameters sent with every page request.
+            per_page (int): Number of items requested per page.
+            workers (int): Number of pages fetched concurrently.
+            ordered (bool): Yield pages in page order rather than completion order
+                when fetching concurrently.
+            start_page (int): The first page fetched, eg to resume an interrupted walk.
+            **kwargs: Passed through to `get()`.
+
+        Yields:
+            WooCommerceCollection: The validated collection for each page.
+
+        Raises:
+            ValueError: If the endpoint does not map to a collection model.
+            requests.HTTPError: If a page request fails.
+
+        """
+        pages = self.iter_numbered_pages(
+            endpoint,
+            params,
+            per_page,
+            workers,
+            ordered=ordered,
+            start_page=start_page,
+            **kwargs,
+        )
+        for _, collection in pages:
+            yield collection
+
+    def iter_numbered_pages(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = 100,
+        workers: int = 1,
+        *,
+        ordered: bool = True,
+        start_page: int = 1,
+        **kwargs,
+    ) -> Iterator[tuple[int, wc_collections.WooCommerceCollection]]:
+        """
+        Fetch a collection endpoint page by page, yielding each page number and validated page.
+
+        Takes the same arguments as `iter_pages()`. Empty pages are not
+        yielded, so the page numbers are not always consecutive.
+
+        Yields:
+            tuple[int, WooCommerceCollection]: The page number and validated collection of each page.
+
+        """
+        page = start_page
+        while page is not None:
+            collection, response = self._fetch_page(endpoint, page, params, per_page, **kwargs)
+            if not collection.root:
+                return
+            total_pages = response.headers.get("X-WP-TotalPages")
+            fetched_page, page = page, response.next_page(page)
+            # Release the raw response before handing the page to the caller
+            del response
+            yield fetched_page, collection
+            if workers > 1 and page is not None and total_pages is not None:
+                yield from self._iter_pages_concurrently(
+                    endpoint,
+                    range(page, int(total_pages) + 1),
+                    params,
+                    per_page,
+                    workers,
+                    ordered=ordered,
+                    **kwargs,
+                )
+                return
+
+    def _iter_pages_concurrently(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        pages: range,
+        params: dict | None,
+        per_page: int,
+        workers: int,
+        *,
+        ordered: bool,
+        **kwargs,
+    ) -> Iterator[tuple[int, wc_collections.WooCommerceCollection]]:
+        """Fetch the given pages on a thread pool, yielding the number and validated page of each non-empty page."""
+        page_numbers = iter(pages)
+        # Page number of each request in flight, in page order
+        in_flight: dict[Future, int] = {}
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wc-pages")
+
+        def submit_next() -> None:
+            if (page := next(page_numbers, None)) is not None:
+                in_flight[executor.submit(self._fetch_page, endpoint, page, params, per_page, **kwargs)] = page
 
-    def get(self, endpoint: str, **kwargs) -> WooDataResponse:
-        response = super().get(endpoint, **kwargs)
-        return WooDataResponse(response)
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+            while in_flight:
+                if ordered:
+                    future = next(iter(in_flight))
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                page = in_flight.pop(future)
+                collection = future.result()[0]
+                del future
+                submit_next()
+                if collection.root:
+                    yield page, collection
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = 100,
+        workers: int = 1,
+        *,
+        ordered: bool = True,
+        **kwargs,
+    ) -> Iterator[wc_resources.WooCommerceResource]:
+        """
+        Fetch a collection endpoint page by page, yielding each validated item.
+
+        Items are de-duplicated by `id`, as rows can shift between pages when
+        the collection changes during a long walk.
+
+        Args:
+            endpoint (str): Collection endpoint, eg "orders".
+            params (dict | None): Query parameters sent with every page request.
+            per_page (int): Number of items requested per page.
+            workers (int): Number of pages fetched concurrently, see `iter_pages()`.
+            ordered (bool): Yield pages in page order when fetching concurrently.
+            **kwargs: Passed through to `get()`.
+
+        Yields:
+            WooCommerceResource: Each validated item, eg `wc_resources.ShopOrder`.
+
+        """
+        seen_ids = set()
+        for collection in self.iter_pages(
+            endpoint,
+            params=params,
+            per_page=per_page,
+            workers=workers,
+            ordered=ordered,
+            **kwargs,
+        ):
+            yield from unseen_items(collection.root, seen_ids)
@@ -0,0 +1,337 @@
+"""
+Asyncio client for the WooCommerce REST API.
+
+Mirrors `wc_api.API` on top of `httpx`, which is an optional dependency:
+
+    pip install woocommerce-pydantic[async]
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from time import time
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+from pydantic import BaseModel
+from woocommerce import __version__ as woocommerce_version
+from woocommerce.oauth import OAuth
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.wc_api import WooDataMixin, unseen_items
+
+
+class AsyncWooDataResponse(WooDataMixin):
+    """Wraps an httpx Response object to add a data() method."""
+
+    def __init__(self, original_response: httpx.Response) -> None:
+        """
+        Wrap an httpx Response instance.
+
+        Args:
+            original_response (httpx.Response): The original Response instance.
+
+        """
+        self.response = original_response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.response, name)
+
+    @property
+    def url(self) -> str:
+        return str(self.response.url)
+
+
+class AsyncAPI:
+    """
+    Asyncio counterpart of `wc_api.API`, returning AsyncWooDataResponse objects.
+
+    Accepts the same options as the woocommerce API class, plus `trusted` and
+    `instance_cache` as for `wc_api.API`. A shared `httpx.AsyncClient` is
+    created on first use, or can be passed in as `client` (eg with a mock
+    transport for testing).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        consumer_key: str,
+        consumer_secret: str,
+        client: httpx.AsyncClient | None = None,
+        **kwargs,
+    ) -> None:
+        self.url = url
+        self.consumer_key = consumer_key
+        self.consumer_secret = consumer_secret
+        self.wp_api = kwargs.get("wp_api", True)
+        self.version = kwargs.get("version", "wc/v3")
+        self.is_ssl = self.url.startswith("https")
+        self.timeout = kwargs.get("timeout", 5)
+        self.verify_ssl = kwargs.get("verify_ssl", True)
+        self.query_string_auth = kwargs.get("query_string_auth", False)
+        self.user_agent = kwargs.get("user_agent", f"WooCommerce-Python-REST-API/{woocommerce_version}")
+        self.client = client
+        self.trusted = kwargs.get("trusted", False)
+        self.instance_cache = kwargs.get("instance_cache")
+
+    async def __aenter__(self) -> AsyncAPI:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self.client is not None:
+            await self.client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout)
+        return self.client
+
+    def _get_url(self, endpoint: str) -> str:
+        url = self.url if self.url.endswith("/") else f"{self.url}/"
+        api = "wp-json" if self.wp_api else "wc-api"
+        return f"{url}{api}/{self.version}/{endpoint}"
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any | None,  # noqa: ANN401
+        params: dict | None = None,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> AsyncWooDataResponse:
+        """
+        Send a request, authenticating the same way as the woocommerce API class.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): API endpoint, eg "orders".
+            data (Any | None): JSON request body. Models are serialised directly
+                to JSON with only the fields that were set.
+            params (dict | None): Query parameters.
+            deadline (float | None): Seconds after which the request is cancelled
+                with `TimeoutError`, covering the whole request, from connecting to
+                reading the body, unlike the per-operation `timeout`.
+            **kwargs: Passed through to `httpx.AsyncClient.request()`.
+
+        """
+        params = dict(params or {})
+        url = self._get_url(endpoint)
+        auth = None
+        headers = {"user-agent": self.user_agent, "accept": "application/json"}
+
+        if self.is_ssl and not self.query_string_auth:
+            auth = httpx.BasicAuth(self.consumer_key, self.consumer_secret)
+        elif self.is_ssl and self.query_string_auth:
+            params.update({"consumer_key": self.consumer_key, "consumer_secret": self.consumer_secret})
+        else:
+            oauth = OAuth(
+                url=f"{url}?{urlencode(params)}",
+                consumer_key=self.consumer_key,
+                consumer_secret=self.consumer_secret,
+                version=self.version,
+                method=method,
+                oauth_timestamp=int(time()),
+            )
+            url = oauth.get_oauth_url()
+            params = {}
+
+        if isinstance(data, BaseModel):
+            headers["content-type"] = "application/json;charset=utf-8"
+            kwargs["content"] = data.model_dump_json(by_alias=True, exclude_unset=True).encode("utf-8")
+            data = None
+
+        request = self._get_client().request(
+            method,
+            url,
+            params=params or None,
+            json=data,
+            auth=auth,
+            headers=headers,
+            **kwargs,
+        )
+        response = AsyncWooDataResponse(
+            await asyncio.wait_for(request, deadline) if deadline is not None else await request,
+        )
+        response.trusted = self.trusted
+        response.instance_cache = self.instance_cache
+        return response
+
+    async def get(self, endpoint: str, fields: Iterable[str] | None = None, **kwargs) -> AsyncWooDataResponse:
+        if fields:
+            kwargs["params"] = {**(kwargs.get("params") or {}), "_fields": ",".join(fields)}
+        return await self._request("GET", endpoint, None, **kwargs)
+
+    async def post(self, endpoint: str, data: Any, **kwargs) -> AsyncWooDataResponse:  # noqa: ANN401
+        return await self._request("POST", endpoint, data, **kwargs)
+
+    async def put(self, endpoint: str, data: Any, **kwargs) -> AsyncWooDataResponse:  # noqa: ANN401
+        return await self._request("PUT", endpoint, data, **kwargs)
+
+    async def delete(self, endpoint: str, *, force: bool = False, **kwargs) -> AsyncWooDataResponse:
+        if force:
+            kwargs["params"] = {**(kwargs.get("params") or {}), "force": "true"}
+        return await self._request("DELETE", endpoint, None, **kwargs)
+
+    async def options(self, endpoint: str, **kwargs) -> AsyncWooDataResponse:
+        return await self._request("OPTIONS", endpoint, None, **kwargs)
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        page: int,
+        params: dict | None,
+        per_page: int,
+        **kwargs,
+    ) -> tuple[wc_collections.WooCommerceCollection, AsyncWooDataResponse]:
+        """
+        Request a single page of a collection endpoint and validate it.
+
+        Raises:
+            ValueError: If the endpoint does not map to a collection model.
+            httpx.HTTPStatusError: If the page request fails.
+
+        """
+        response = await self.get(endpoint, params={**(params or {}), "page": page, "per_page": per_page}, **kwargs)
+        response.raise_for_status()
+        collection = response.data()
+        if not isinstance(collection, wc_collections.WooCommerceCollection):
+            msg = f"WooCommerce API endpoint '{endpoint}' is not a collection endpoint."
+            raise ValueError(msg)  # noqa: TRY004
+        return collection, response
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = 100,
+        concurrency: int = 1,
+        *,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[wc_collections.WooCommerceCollection]:
+        """
+        Fetch a collection endpoint page by page, yielding each validated page.
+
+        Behaves like `API.iter_pages()`, with `concurrency` pages requested at
+        once on the event loop after the first page reveals `X-WP-TotalPages`.
+        Closing the iterator cancels any pages still in flight.
+
+        Args:
+            endpoint (str): Collection endpoint, eg "orders".
+            params (dict | None): Query parameters sent with every page request.
+            per_page (int): Number of items requested per page.
+            concurrency (int): Number of pages fetched concurrently.
+            ordered (bool): Yield pages in page order rather than completion order
+                when fetching concurrently.
+            **kwargs: Passed through to `get()`.
+
+        Yields:
+            WooCommerceCollection: The validated collection for each page.
+
+        """
+        page = 1
+        while page is not None:
+            collection, response = await self._fetch_page(endpoint, page, params, per_page, **kwargs)
+            if not collection.root:
+                return
+            total_pages = response.headers.get("X-WP-TotalPages")
+            page = response.next_page(page)
+            del response
+            yield collection
+            if concurrency > 1 and page is not None and total_pages is not None:
+                pages = self._iter_pages_concurrently(
+                    endpoint,
+                    range(page, int(total_pages) + 1),
+                    params,
+                    per_page,
+                    concurrency,
+                    ordered=ordered,
+                    **kwargs,
+                )
+                try:
+                    async for collection in pages:
+                        yield collection
+                finally:
+                    # Cancel the pages still in flight when the caller stops early
+                    await pages.aclose()
+                return
+
+    async def _iter_pages_concurrently(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        pages: range,
+        params: dict | None,
+        per_page: int,
+        concurrency: int,
+        *,
+        ordered: bool,
+        **kwargs,
+    ) -> AsyncIterator[wc_collections.WooCommerceCollection]:
+        """Fetch the given pages as tasks, yielding each non-empty validated page."""
+        page_numbers = iter(pages)
+        in_flight: deque[asyncio.Task] = deque()
+
+        def submit_next() -> None:
+            if (page := next(page_numbers, None)) is not None:
+                coroutine = self._fetch_page(endpoint, page, params, per_page, **kwargs)
+                in_flight.append(asyncio.ensure_future(coroutine))
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+            while in_flight:
+                if ordered:
+                    task = in_flight.popleft()
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    task = done.pop()
+                    in_flight.remove(task)
+                collection = (await task)[0]
+                del task
+                submit_next()
+                if collection.root:
+                    yield collection
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Wait for the cancelled requests to finish, so their connections are released
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def iter_items(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = 100,
+        concurrency: int = 1,
+        *,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[wc_resources.WooCommerceResource]:
+        """
+        Fetch a collection endpoint page by page, yielding each validated item.
+
+        Items are de-duplicated by `id`, as in `API.iter_items()`.
+        """
+        seen_ids = set()
+        pages = self.iter_pages(
+            endpoint,
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            ordered=ordered,
+            **kwargs,
+        )
+        try:
+            async for collection in pages:
+                for item in unseen_items(collection.root, seen_ids):
+                    yield item
+        finally:
+            # Cancel the pages still in flight when the caller stops early
+            await pages.aclose()
@@ -0,0 +1,192 @@
+"""
+Batch writes through the WooCommerce `/batch` endpoints.
+
+WooCommerce accepts at most 100 create, update and delete operations per
+batch request. `BatchWriter` splits any number of operations into chunks,
+sends the chunks concurrently, and returns the validated results:
+
+    writer = BatchWriter(wcapi, "products/12/variations")
+    result = writer.run(update=[ProductVariation(id=15, regular_price="9.99"), ...])
+    for error in result.errors:
+        print(error.action, error.id, error.message)
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import ValidationError
+from requests import JSONDecodeError, RequestException
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.wc_api import API
+
+BATCH_LIMIT = 100
+ACTIONS = ("create", "update", "delete")
+
+
+@dataclass
+class BatchError:
+    """An operation of a batch that failed."""
+
+    action: str
+    id: int | None
+    code: str
+    message: str
+    data: Any = None
+
+
+@dataclass
+class BatchResult:
+    """Validated results of the operations of a batch, in the order they were given."""
+
+    created: list[wc_resources.WooCommerceResource] = field(default_factory=list)
+    updated: list[wc_resources.WooCommerceResource] = field(default_factory=list)
+    deleted: list[wc_resources.WooCommerceResource] = field(default_factory=list)
+    errors: list[BatchError] = field(default_factory=list)
+
+    def extend(self, other: BatchResult) -> None:
+        self.created.extend(other.created)
+        self.updated.extend(other.updated)
+        self.deleted.extend(other.deleted)
+        self.errors.extend(other.errors)
+
+
+class BatchWriter:
+    """
+    Sends create, update and delete operations to a collection's batch endpoint.
+
+    Args:
+        api (API): The API used to send the batches.
+        endpoint (str): Collection endpoint, eg "products" or "products/12/variations".
+        chunk_size (int): Operations per batch request, at most 100.
+        max_workers (int): Number of batch requests sent concurrently.
+
+    """
+
+    def __init__(self, api: API, endpoint: str, chunk_size: int = BATCH_LIMIT, max_workers: int = 4) -> None:
+        self.api = api
+        self.endpoint = endpoint.strip("/")
+        self.chunk_size = min(chunk_size, BATCH_LIMIT)
+        self.max_workers = max_workers
+        model = api.get_endpoint_model(self.endpoint)
+        if model is None or not issubclass(model, wc_collections.WooCommerceCollection):
+            msg = f"WooCommerce API endpoint '{self.endpoint}' is not a collection endpoint."
+            raise ValueError(msg)
+        self.item_model = model.item_model()
+
+    def run(
+        self,
+        create: Iterable[wc_resources.WooCommerceResource | dict] = (),
+        update: Iterable[wc_resources.WooCommerceResource | dict] = (),
+        delete: Iterable[wc_resources.WooCommerceResource | int] = (),
+    ) -> BatchResult:
+        """
+        Send the operations in chunks and collect their results.
+
+        A chunk whose request fails, eg on a connection error, is reported as
+        an error of each of its operations, and a result that fails validation
+        as an error of its operation, while the results of the other chunks
+        and operations, which may already be applied, are still returned.
+
+        Args:
+            create (Iterable[WooCommerceResource | dict]): Resources to create.
+            update (Iterable[WooCommerceResource | dict]): Resources to update, with their `id`.
+            delete (Iterable[WooCommerceResource | int]): Resources or ids to delete.
+
+        Returns:
+            BatchResult: The created, updated and deleted resources, and the errors.
+
+        """
+        operations = [
+            *(("create", _payload(item)) for item in create),
+            *(("update", _payload(item)) for item in update),
+            *(("delete", item if isinstance(item, int) else item.id) for item in delete),
+        ]
+        chunks = [operations[i : i + self.chunk_size] for i in range(0, len(operations), self.chunk_size)]
+
+        result = BatchResult()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="wc-batch") as executor:
+            for chunk_result in executor.map(self._send, chunks):
+                result.extend(chunk_result)
+        return result
+
+    def _send(self, chunk: list[tuple[str, Any]]) -> BatchResult:
+        """Send one batch request and validate its results."""
+        body = {action: [payload for a, payload in chunk if a == action] for action in ACTIONS}
+        try:
+            response = self.api.post(f"{self.endpoint}/batch", {action: ops for action, ops in body.items() if ops})
+        except RequestException as exc:
+            # The other chunks may already be applied, so their results are still returned
+            return _chunk_errors(chunk, type(exc).__name__, str(exc))
+
+        if not response.ok:
+            try:
+                error = response.json()
+            except JSONDecodeError:
+                error = {}
+            if not isinstance(error, dict):
+                error = {}
+            code = error.get("code", str(response.status_code))
+            return _chunk_errors(chunk, code, error.get("message", response.reason or ""), error.get("data"))
+        try:
+            data = response.json()
+        except JSONDecodeError as exc:
+            return _chunk_errors(chunk, type(exc).__name__, str(exc))
+
+        result = BatchResult()
+        results = {"create": result.created, "update": result.updated, "delete": result.deleted}
+        for action in ACTIONS:
+            for item in data.get(action, []):
+                item_result = self._item_result(action, item)
+                if isinstance(item_result, BatchError):
+                    result.errors.append(item_result)
+                else:
+                    results[action].append(item_result)
+        return result
+
+    def _item_result(self, action: str, item: dict) -> wc_resources.WooCommerceResource | BatchError:
+        """Return the validated result of an operation, or its error."""
+        if error := item.get("error"):
+            if not isinstance(error, dict):
+                return BatchError(action=action, id=item.get("id") or None, code="", message=str(error))
+            return BatchError(
+                action=action,
+                id=item.get("id") or None,
+                code=error.get("code", ""),
+                message=error.get("message", ""),
+                data=error.get("data"),
+            )
+        try:
+            return self.item_model.model_validate(item)
+        except ValidationError as exc:
+            # The operation is applied, so its raw result is kept with the error
+            return BatchError(action=action, id=item.get("id"), code=type(exc).__name__, message=str(exc), data=item)
+
+
+def _chunk_errors(
+    chunk: list[tuple[str, Any]],
+    code: str,
+    message: str,
+    data: Any = None,  # noqa: ANN401
+) -> BatchResult:
+    """Return the same error for every operation of a chunk."""
+    errors = [
+        BatchError(
+            action=action,
+            id=payload if action == "delete" else payload.get("id"),
+            code=code,
+            message=message,
+            data=data,
+        )
+        for action, payload in chunk
+    ]
+    return BatchResult(errors=errors)
+
+
+def _payload(item: wc_resources.WooCommerceResource | dict) -> dict:
+    if isinstance(item, dict):
+        return item
+    return item.model_dump(mode="json", by_alias=True, exclude_unset=True)
@@ -0,0 +1,221 @@
+"""
+Response caches for GET requests.
+
+A cache is passed to the API with the `cache` option. Successful GET
+responses are stored under the store url, API version, endpoint and
+normalised query parameters, for a time to live chosen per endpoint
+template, eg:
+
+    cache = MemoryCache(ttl=60, ttls={"/data/countries": 86400, "/taxes": 3600})
+    wcapi = API(url=..., consumer_key=..., consumer_secret=..., cache=cache)
+
+`MemoryCache` keeps entries in the process, optionally as validated models.
+`SQLiteCache` keeps raw responses in a SQLite database file, which can be
+shared by several processes.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import time
+from typing import Any
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from woocommerce_pydantic.wcapi import models
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    # Validated data() result, set by the first data() call when the cache stores models
+    data: Any = None
+
+    @classmethod
+    def from_response(cls, response: Response) -> CacheEntry:
+        return cls(
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+        )
+
+    def to_response(self) -> Response:
+        """Rebuild a requests Response from the entry."""
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content  # noqa: SLF001
+        response.encoding = "utf-8"
+        return response
+
+
+class ResponseCache(ABC):
+    """
+    Base class of response caches, choosing the time to live of each entry.
+
+    Args:
+        ttl (float): Default time to live in seconds.
+        ttls (dict[str, float] | None): Time to live per endpoint template, as
+            in `wc_endpoints.RESPONSE_MODELS`, eg {"/data/countries": 86400}.
+            Endpoints with a time to live of 0 are not cached.
+        maxsize (int): Maximum number of entries, the least recently used
+            entries are evicted beyond it.
+
+    """
+
+    store_models = False
+
+    def __init__(self, ttl: float = 60, ttls: dict[str, float] | None = None, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.maxsize = maxsize
+
+    def make_key(self, endpoint: str, params: dict | None, url: str = "", version: str = "") -> str:
+        """
+        Return the cache key of a request, independent of the parameter order.
+
+        Args:
+            endpoint (str): API endpoint, eg "orders".
+            params (dict | None): Query parameters of the request.
+            url (str): Store url, so stores sharing a cache do not share entries.
+            version (str): API version, eg "wc/v3".
+
+        Returns:
+            str: The key, eg "https://example.com/wc/v3/orders?page=2".
+
+        """
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return f"{url.rstrip('/')}/{version.strip('/')}/{endpoint.strip('/')}?{query}"
+
+    def ttl_for(self, url: str) -> float:
+        """Return the time to live of the response to a request url."""
+        match = models.wc_endpoints.resolve_endpoint(url)
+        return self.ttls.get(match.template, self.ttl) if match else self.ttl
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry of a key, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        """Store an entry for `ttl` seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU response cache.
+
+    Args:
+        store_models (bool): Also store the validated `data()` result of each
+            entry, once it is first computed. Cached models are shared between
+            callers, so they should not be mutated.
+        **kwargs: See `ResponseCache`.
+
+    """
+
+    def __init__(self, *, store_models: bool = False, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.store_models = store_models
+        self._entries: OrderedDict[str, tuple[float, CacheEntry]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            if (item := self._entries.get(key)) is None:
+                return None
+            expires, entry = item
+            if expires <= time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    LRU response cache in a SQLite database, shareable between processes.
+
+    Args:
+        path (str): Path of the database file.
+        **kwargs: See `ResponseCache`.
+
+    """
+
+    def __init__(self, path: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, expires REAL, accessed REAL,"
+                " url TEXT, status_code INTEGER, headers TEXT, content BLOB)",
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads, so keep one per thread
+        if (connection := getattr(self._local, "connection", None)) is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> CacheEntry | None:
+        now = time()
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT url, status_code, headers, content FROM responses WHERE key = ? AND expires > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        url, status_code, headers, content = row
+        return CacheEntry(url=url, status_code=status_code, headers=json.loads(headers), content=content)
+
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        now = time()
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, now + ttl, now, entry.url, entry.status_code, json.dumps(entry.headers), entry.content),
+            )
+            connection.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            connection.execute(
+                "DELETE FROM responses WHERE key IN"
+                " (SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
@@ -0,0 +1,145 @@
+"""
+Concurrent fetching of the sub-resources of a collection.
+
+`FanOut` joins each parent resource with its child collections, fetching the
+children of all parents concurrently rather than in an N+1 loop:
+
+    for joined in FanOut(wcapi, max_workers=8).join(wcapi.get("orders").data()):
+        print(joined.parent.id, len(joined.children["notes"].root), len(joined.children["refunds"].root))
+
+The children fetched for each parent collection are listed in `RELATIONS`,
+eg the notes and refunds of orders, and the variations of variable products.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.wc_api import API
+
+
+@dataclass(frozen=True)
+class Relation:
+    """A child collection of a parent resource."""
+
+    # Key of the children in Joined.children, eg "notes"
+    name: str
+    # Endpoint of the children, formatted with the parent's id, eg "orders/{id}/notes"
+    endpoint: str
+    # Whether a parent has children, eg only variable products have variations
+    applies: Callable[[wc_resources.WooCommerceResource], bool] | None = None
+
+
+def _is_variable_product(product: wc_resources.WooCommerceResource) -> bool:
+    return getattr(product, "type", None) == wc_resources.Type1.variable
+
+
+RELATIONS: dict[type[wc_collections.WooCommerceCollection], tuple[Relation, ...]] = {
+    wc_collections.ShopOrderList: (
+        Relation("notes", "orders/{id}/notes"),
+        Relation("refunds", "orders/{id}/refunds"),
+    ),
+    wc_collections.ProductList: (Relation("variations", "products/{id}/variations", _is_variable_product),),
+}
+
+
+@dataclass
+class Joined:
+    """A parent resource with its child collections, by relation name."""
+
+    parent: wc_resources.WooCommerceResource
+    children: dict[str, wc_collections.WooCommerceCollection] = field(default_factory=dict)
+
+
+class FanOut:
+    """
+    Fetches the child collections of parent resources concurrently.
+
+    Args:
+        api (API): The API used to fetch the children.
+        max_workers (int): Number of child collections fetched concurrently.
+        per_page (int): Number of children requested per page, for children
+            spanning several pages, eg the variations of a large product.
+
+    """
+
+    def __init__(self, api: API, max_workers: int = 8, per_page: int = 100) -> None:
+        self.api = api
+        self.max_workers = max_workers
+        self.per_page = per_page
+
+    def join(
+        self,
+        parents: wc_collections.WooCommerceCollection,
+        relations: Iterable[Relation] | None = None,
+    ) -> list[Joined]:
+        """
+        Fetch the children of each parent and join them.
+
+        Args:
+            parents (WooCommerceCollection): The parents, eg a ShopOrderList.
+            relations (Iterable[Relation] | None): The children to fetch,
+                defaults to the `RELATIONS` of the parent collection.
+
+        Returns:
+            list[Joined]: The parents in their order, each with its children.
+                Parents a relation does not apply to have no children for it.
+
+        Raises:
+            ValueError: If no relations are given or known for the parents.
+
+        """
+        relations = self._relations(type(parents), relations)
+        joined = [Joined(parent) for parent in parents.root]
+        tasks = [
+            (item, relation)
+            for item in joined
+            for relation in relations
+            if relation.applies is None or relation.applies(item.parent)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="wc-fanout") as executor:
+            for (item, relation), children in zip(tasks, executor.map(self._fetch_children, tasks)):
+                item.children[relation.name] = children
+        return joined
+
+    def iter_pages(self, endpoint: str, params: dict | None = None, **kwargs) -> Iterator[list[Joined]]:
+        """
+        Fetch a parent collection page by page, yielding each page joined with its children.
+
+        Args:
+            endpoint (str): Parent collection endpoint, eg "orders".
+            params (dict | None): Query parameters sent with every page request.
+            **kwargs: Passed through to `API.iter_pages()`.
+
+        Yields:
+            list[Joined]: The parents of each page, with their children.
+
+        """
+        relations = self._relations(self.api.get_endpoint_model(endpoint))
+        for page in self.api.iter_pages(endpoint, params=params, **kwargs):
+            yield self.join(page, relations)
+
+    @staticmethod
+    def _relations(
+        model: type | None,
+        relations: Iterable[Relation] | None = None,
+    ) -> tuple[Relation, ...]:
+        relations = tuple(relations) if relations is not None else RELATIONS.get(model, ())
+        if not relations:
+            name = model.__name__ if model is not None else None
+            msg = f"No sub-resources are known for {name}, pass the relations to fetch."
+            raise ValueError(msg)
+        return relations
+
+    def _fetch_children(self, task: tuple[Joined, Relation]) -> wc_collections.WooCommerceCollection:
+        """Fetch all the pages of the children of a parent for a relation."""
+        item, relation = task
+        endpoint = relation.endpoint.format(id=item.parent.id)
+        pages = list(self.api.iter_pages(endpoint, per_page=self.per_page))
+        if len(pages) == 1:
+            return pages[0]
+        # No pages are yielded for an empty collection
+        model = type(pages[0]) if pages else self.api.get_endpoint_model(endpoint)
+        return model.model_construct([child for page in pages for child in page.root])
@@ -0,0 +1,150 @@
+"""
+Client-side rate limiting with adaptive concurrency.
+
+A `RateLimiter` passed to the API as `rate_limiter` is shared by every
+request the API makes, including concurrent page fetches and batches. It
+combines:
+
+- a token bucket, capping the request rate at `rate` per second with bursts
+  of up to `burst` requests,
+- an AIMD concurrency limit: the number of requests in flight grows by about
+  one per round of successful requests, and is multiplied by `decrease` on a
+  429 or 5xx response, or when latency grows beyond `latency_factor` times the
+  baseline latency, a moving average of the latencies of successful requests,
+- a pause of all requests for the duration given by `Retry-After`.
+
+With a limiter, the API sends every attempt of a request through it: 429 and
+503 responses are retried by the API after the limiter has backed off, rather
+than by urllib3, so the limiter sees each of them and latencies do not include
+urllib3's retry sleeps.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limit with AIMD concurrency control.
+
+    Args:
+        rate (float | None): Maximum requests per second, or None for no rate limit.
+        burst (int): Maximum number of requests sent at once at full rate.
+        initial_concurrency (float): Requests allowed in flight to start with.
+        min_concurrency (float): Lowest concurrency limit backed off to.
+        max_concurrency (float): Highest concurrency limit ramped up to.
+        decrease (float): Factor applied to the concurrency limit on back off.
+        latency_factor (float): Latency growth, relative to the baseline
+            latency, treated as a sign of overload.
+        latency_smoothing (float): Weight of each successful request's
+            latency in the baseline latency moving average.
+        clock (Callable[[], float]): Monotonic clock, in seconds.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        rate: float | None = 10,
+        burst: int = 10,
+        initial_concurrency: float = 4,
+        min_concurrency: float = 1,
+        max_concurrency: float = 32,
+        decrease: float = 0.5,
+        latency_factor: float = 3,
+        latency_smoothing: float = 0.1,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.latency_smoothing = latency_smoothing
+        self.clock = clock
+        self.in_flight = 0
+        self.paused_until = 0.0
+        # Exponential moving average of the latencies of successful requests
+        self.baseline_latency: float | None = None
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._condition:
+            while True:
+                now = self.clock()
+                if now < self.paused_until:
+                    self._condition.wait(self.paused_until - now)
+                    continue
+                if self.in_flight >= max(int(self.concurrency), 1):
+                    self._condition.wait()
+                    continue
+                if self.rate is not None:
+                    self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                    self._refilled_at = now
+                    if self._tokens < 1:
+                        self._condition.wait((1 - self._tokens) / self.rate)
+                        continue
+                    self._tokens -= 1
+                self.in_flight += 1
+                return
+
+    def release(self, status_code: int | None, latency: float, retry_after: str | None = None) -> None:
+        """
+        Record the outcome of a request sent after `acquire()`.
+
+        Args:
+            status_code (int | None): Response status, or None if the request failed.
+            latency (float): Seconds the request took.
+            retry_after (str | None): The `Retry-After` response header.
+
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = self.clock()
+            if retry_after and (delay := parse_retry_after(retry_after)) is not None:
+                self.paused_until = max(self.paused_until, now + delay)
+
+            if status_code is None or status_code in THROTTLED_STATUS_CODES or status_code >= 500:  # noqa: PLR2004
+                self._back_off(now, latency)
+            else:
+                if self.baseline_latency is not None and latency > self.baseline_latency * self.latency_factor:
+                    self._back_off(now, latency)
+                else:
+                    # Additive increase, of about one per round of requests in flight
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+                if self.baseline_latency is None:
+                    self.baseline_latency = latency
+                else:
+                    self.baseline_latency += (latency - self.baseline_latency) * self.latency_smoothing
+            self._condition.notify_all()
+
+    def _back_off(self, now: float, latency: float) -> None:
+        # Requests sent before a back off report the same overload, so back off once per round
+        if now - self._decreased_at < max(latency, self.baseline_latency or 0):
+            return
+        self._decreased_at = now
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Return the delay in seconds of a `Retry-After` header, given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
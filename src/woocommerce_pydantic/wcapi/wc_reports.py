@@ -0,0 +1,412 @@
+"""
+Local computation of the WooCommerce reports from validated resources.
+
+The `/reports` endpoints run aggregate queries on the store's database, which
+are slow on large stores. `ReportEngine` computes the same report models from
+orders, products and customers fetched once, and is updated incrementally as
+resources are added or change:
+
+    engine = ReportEngine()
+    engine.add_orders(wcapi.iter_items("orders"))
+    engine.sales(date_min=date(2025, 1, 1), date_max=date(2025, 1, 31))   # SalesReport
+    engine.sales_totals(group_by="week")                                   # {"2025-01-06": SalesTotals, ...}
+    engine.top_sellers(limit=5)                                            # TopSellersReportList
+
+The engine is also a `wc_sync.Sink`, so a `SyncEngine` can keep it up to date.
+
+Sales are counted for orders whose status is in `SALES_STATUSES`, on the day
+of their `date_created`, net of refunds. Aggregates are kept per day, so an
+order changing status or totals only updates the day it was placed on.
+"""
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+
+# Order statuses counted in sales, as in WooCommerce's sales report
+SALES_STATUSES = frozenset({"completed", "processing", "on-hold", "refunded"})
+# Order statuses making a customer a paying customer
+PAID_STATUSES = frozenset({"completed", "processing"})
+GROUP_BY = ("day", "week", "month", "year")
+
+ORDER_STATUS_NAMES = {
+    "pending": "Pending payment",
+    "processing": "Processing",
+    "on-hold": "On hold",
+    "completed": "Completed",
+    "cancelled": "Cancelled",
+    "refunded": "Refunded",
+    "failed": "Failed",
+}
+PRODUCT_TYPE_NAMES = {
+    "external": "External/Affiliate product",
+    "grouped": "Grouped product",
+    "simple": "Simple product",
+    "variable": "Variable product",
+}
+CUSTOMER_TYPE_NAMES = {"paying": "Paying customer", "non_paying": "Non-paying customer"}
+
+ZERO = Decimal(0)
+
+
+@dataclass
+class SalesTotals:
+    """Sales of a period, as in the `totals` of WooCommerce's sales report."""
+
+    # Gross sales, net of refunds
+    sales: Decimal = ZERO
+    orders: int = 0
+    items: int = 0
+    tax: Decimal = ZERO
+    shipping: Decimal = ZERO
+    # Number of coupons used
+    discount: int = 0
+    # Number of distinct registered customers who placed orders
+    customers: int = 0
+
+
+@dataclass(frozen=True)
+class _OrderFacts:
+    """What an order contributes to the reports."""
+
+    day: date | None
+    status: str
+    customer_id: int
+    total: Decimal
+    refunded: Decimal
+    tax: Decimal
+    shipping: Decimal
+    items: int
+    coupons: int
+    # (product_id, quantity) of the line items
+    products: tuple[tuple[int, int], ...]
+
+    @property
+    def is_sale(self) -> bool:
+        return self.day is not None and self.status in SALES_STATUSES
+
+
+@dataclass
+class _Bucket:
+    """Sales aggregates of a day, or of the days of a period."""
+
+    sales: Decimal = ZERO
+    refunded: Decimal = ZERO
+    tax: Decimal = ZERO
+    shipping: Decimal = ZERO
+    orders: int = 0
+    items: int = 0
+    coupons: int = 0
+    refunds: int = 0
+    customers: Counter = field(default_factory=Counter)
+    products: Counter = field(default_factory=Counter)
+
+    def apply(self, facts: _OrderFacts, sign: int) -> None:
+        """Add an order to the aggregates, or remove it with a sign of -1."""
+        self.sales += sign * facts.total
+        self.refunded += sign * facts.refunded
+        self.tax += sign * facts.tax
+        self.shipping += sign * facts.shipping
+        self.orders += sign
+        self.items += sign * facts.items
+        self.coupons += sign * facts.coupons
+        self.refunds += sign * bool(facts.refunded)
+        # Guest orders have no customer id
+        if facts.customer_id:
+            _count(self.customers, facts.customer_id, sign)
+        for product_id, quantity in facts.products:
+            _count(self.products, product_id, sign * quantity)
+
+    def merge(self, other: _Bucket) -> None:
+        self.sales += other.sales
+        self.refunded += other.refunded
+        self.tax += other.tax
+        self.shipping += other.shipping
+        self.orders += other.orders
+        self.items += other.items
+        self.coupons += other.coupons
+        self.refunds += other.refunds
+        self.customers.update(other.customers)
+        self.products.update(other.products)
+
+
+class ReportEngine:
+    """Computes the WooCommerce report models from orders, products and customers."""
+
+    def __init__(self) -> None:
+        self._orders: dict[int, _OrderFacts] = {}
+        self._days: dict[date, _Bucket] = {}
+        self._statuses: Counter = Counter()
+        self._paid_orders: Counter = Counter()
+        self._product_names: dict[int, str] = {}
+        self._product_types: dict[int, str] = {}
+        self._customers: dict[int, bool] = {}
+        self._lock = threading.Lock()
+
+    def add_orders(self, orders: Iterable[wc_resources.ShopOrder]) -> None:
+        """Add orders, replacing the earlier versions of orders already added."""
+        with self._lock:
+            for order in orders:
+                if order.id is None:
+                    continue
+                self._remove(order.id)
+                facts = _order_facts(order)
+                self._orders[order.id] = facts
+                self._apply(facts, 1)
+                for line_item in order.line_items or ():
+                    if line_item.product_id and line_item.name:
+                        self._product_names[line_item.product_id] = line_item.name
+
+    def remove_orders(self, order_ids: Iterable[int]) -> None:
+        """Remove orders, eg deleted orders."""
+        with self._lock:
+            for order_id in order_ids:
+                self._remove(order_id)
+
+    def add_products(self, products: Iterable[wc_resources.Product]) -> None:
+        """Add products, for the product totals and top seller names."""
+        with self._lock:
+            for product in products:
+                if product.id is None:
+                    continue
+                if product.type is not None:
+                    self._product_types[product.id] = product.type.value
+                if product.name:
+                    self._product_names[product.id] = product.name
+
+    def add_customers(self, customers: Iterable[wc_resources.Customer]) -> None:
+        """Add customers, for the customer totals."""
+        with self._lock:
+            for customer in customers:
+                if customer.id is not None:
+                    self._customers[customer.id] = bool(customer.is_paying_customer)
+
+    def upsert(self, endpoint: str, items: list[wc_resources.WooCommerceResource]) -> None:  # noqa: ARG002
+        """Add resources received from a `wc_sync.SyncEngine`."""
+        self.add_orders(item for item in items if isinstance(item, wc_resources.ShopOrder))
+        self.add_products(item for item in items if isinstance(item, wc_resources.Product))
+        self.add_customers(item for item in items if isinstance(item, wc_resources.Customer))
+
+    def sales(
+        self,
+        date_min: date | None = None,
+        date_max: date | None = None,
+        group_by: str = "day",
+    ) -> wc_resources.SalesReport:
+        """
+        Return the sales report of a period, as `/reports/sales` does.
+
+        Args:
+            date_min (date | None): First day of the period, the first order's day by default.
+            date_max (date | None): Last day of the period, the last order's day by default.
+            group_by (str): Grouping reported in `totals_grouped_by`, see `sales_totals()`.
+
+        Returns:
+            SalesReport: The report, with amounts as strings with two decimals.
+                `total_refunds` counts the refunded orders and `total_discount`
+                the coupons used, as the model's integer fields describe.
+
+        """
+        _check_group_by(group_by)
+        with self._lock:
+            days = self._days_between(date_min, date_max)
+            bucket = _Bucket()
+            for day in days:
+                bucket.merge(self._days[day])
+        first_day = date_min or (days[0] if days else None)
+        last_day = date_max or (days[-1] if days else None)
+        day_count = (last_day - first_day).days + 1 if first_day and last_day else 1
+        total_sales = bucket.sales - bucket.refunded
+        net_sales = total_sales - bucket.tax - bucket.shipping
+        return wc_resources.SalesReport(
+            total_sales=_money(total_sales),
+            net_sales=_money(net_sales),
+            average_sales=_money(net_sales / day_count),
+            total_orders=bucket.orders,
+            total_items=bucket.items,
+            total_tax=_money(bucket.tax),
+            total_shipping=_money(bucket.shipping),
+            total_refunds=bucket.refunds,
+            total_discount=bucket.coupons,
+            totals_grouped_by=group_by,
+        )
+
+    def sales_totals(
+        self,
+        date_min: date | None = None,
+        date_max: date | None = None,
+        group_by: str = "day",
+    ) -> dict[str, SalesTotals]:
+        """
+        Return the sales of each day, week, month or year of a period.
+
+        Args:
+            date_min (date | None): First day of the period.
+            date_max (date | None): Last day of the period.
+            group_by (str): "day", "week", "month" or "year".
+
+        Returns:
+            dict[str, SalesTotals]: The sales by period, in date order, keyed
+                by day, eg "2025-01-31", Monday of the week, month, eg "2025-01",
+                or year, eg "2025". Periods without sales are omitted.
+
+        Raises:
+            ValueError: If group_by is not a known grouping.
+
+        """
+        _check_group_by(group_by)
+        periods: dict[str, _Bucket] = {}
+        with self._lock:
+            for day in self._days_between(date_min, date_max):
+                periods.setdefault(_period_key(day, group_by), _Bucket()).merge(self._days[day])
+        return {
+            key: SalesTotals(
+                sales=bucket.sales - bucket.refunded,
+                orders=bucket.orders,
+                items=bucket.items,
+                tax=bucket.tax,
+                shipping=bucket.shipping,
+                discount=bucket.coupons,
+                customers=len(bucket.customers),
+            )
+            for key, bucket in periods.items()
+        }
+
+    def top_sellers(
+        self,
+        date_min: date | None = None,
+        date_max: date | None = None,
+        limit: int = 10,
+    ) -> wc_collections.TopSellersReportList:
+        """Return the products sold in the largest quantities in a period, as `/reports/top_sellers` does."""
+        products: Counter = Counter()
+        with self._lock:
+            for day in self._days_between(date_min, date_max):
+                products.update(self._days[day].products)
+        return wc_collections.TopSellersReportList(
+            [
+                wc_resources.TopSellersReport(
+                    name=self._product_names.get(product_id),
+                    product_id=product_id,
+                    quantity=quantity,
+                )
+                for product_id, quantity in products.most_common(limit)
+            ],
+        )
+
+    def order_totals(self) -> wc_collections.ReportOrderTotalList:
+        """Return the number of orders of each status, as `/reports/orders/totals` does."""
+        with self._lock:
+            return _totals(wc_collections.ReportOrderTotalList, ORDER_STATUS_NAMES, self._statuses)
+
+    def product_totals(self) -> wc_collections.ReportProductTotalList:
+        """Return the number of products of each type, as `/reports/products/totals` does."""
+        with self._lock:
+            types = Counter(self._product_types.values())
+        return _totals(wc_collections.ReportProductTotalList, PRODUCT_TYPE_NAMES, types)
+
+    def customer_totals(self) -> wc_collections.ReportCustomerTotalList:
+        """
+        Return the number of paying and non-paying customers, as `/reports/customers/totals` does.
+
+        Customers are those added, and the registered customers of the orders
+        added. A customer is paying if WooCommerce says so, or has a completed
+        or processing order.
+        """
+        with self._lock:
+            customer_ids = set(self._customers) | {facts.customer_id for facts in self._orders.values()}
+            customer_ids.discard(0)
+            paying = sum(
+                1 for customer_id in customer_ids if self._customers.get(customer_id) or self._paid_orders[customer_id]
+            )
+        counts = Counter({"paying": paying, "non_paying": len(customer_ids) - paying})
+        return _totals(wc_collections.ReportCustomerTotalList, CUSTOMER_TYPE_NAMES, counts)
+
+    def _remove(self, order_id: int) -> None:
+        if (facts := self._orders.pop(order_id, None)) is not None:
+            self._apply(facts, -1)
+
+    def _apply(self, facts: _OrderFacts, sign: int) -> None:
+        _count(self._statuses, facts.status, sign)
+        if facts.status in PAID_STATUSES:
+            _count(self._paid_orders, facts.customer_id, sign)
+        if facts.is_sale:
+            bucket = self._days.setdefault(facts.day, _Bucket())
+            bucket.apply(facts, sign)
+            if not bucket.orders:
+                del self._days[facts.day]
+
+    def _days_between(self, date_min: date | None, date_max: date | None) -> list[date]:
+        """Return the days with sales within a period, in order."""
+        return sorted(
+            day for day in self._days if (date_min is None or day >= date_min) and (date_max is None or day <= date_max)
+        )
+
+
+def _order_facts(order: wc_resources.ShopOrder) -> _OrderFacts:
+    status = order.status.value if order.status is not None else ""
+    return _OrderFacts(
+        day=date.fromisoformat(order.date_created[:10]) if order.date_created else None,
+        status=status,
+        customer_id=order.customer_id or 0,
+        total=_decimal(order.total),
+        refunded=sum((abs(_decimal(refund.total)) for refund in order.refunds or ()), ZERO),
+        tax=_decimal(order.total_tax),
+        shipping=_decimal(order.shipping_total),
+        items=sum(line_item.quantity or 0 for line_item in order.line_items or ()),
+        coupons=len(order.coupon_lines or ()),
+        products=tuple(
+            (line_item.product_id, line_item.quantity or 0)
+            for line_item in order.line_items or ()
+            if line_item.product_id
+        ),
+    )
+
+
+def _totals(collection: type, names: dict[str, str], counts: Counter) -> wc_collections.WooCommerceCollection:
+    """Return a totals report listing the count of each slug."""
+    return collection(
+        [collection.item_model()(slug=slug, name=name, total=str(counts[slug])) for slug, name in names.items()],
+    )
+
+
+def _period_key(day: date, group_by: str) -> str:
+    if group_by == "week":
+        return (day - timedelta(days=day.weekday())).isoformat()
+    if group_by == "month":
+        return f"{day.year}-{day.month:02d}"
+    if group_by == "year":
+        return str(day.year)
+    return day.isoformat()
+
+
+def _check_group_by(group_by: str) -> None:
+    if group_by not in GROUP_BY:
+        msg = f"Unknown grouping '{group_by}', use one of {GROUP_BY}."
+        raise ValueError(msg)
+
+
+def _count(counter: Counter, key: object, increment: int) -> None:
+    """Add to a count, dropping counts falling to zero."""
+    counter[key] += increment
+    if not counter[key]:
+        del counter[key]
+
+
+def _decimal(value: str | None) -> Decimal:
+    """Return an amount, counting empty or non-numeric values as 0."""
+    try:
+        amount = Decimal(value) if value else ZERO
+    except InvalidOperation:
+        return ZERO
+    return amount if amount.is_finite() else ZERO
+
+
+def _money(value: Decimal) -> str:
+    return str(value.quantize(Decimal("0.01")))
@@ -0,0 +1,70 @@
+"""
+Coalescing of identical concurrent requests.
+
+With the API's `coalesce` option, a GET sent while an identical GET is in
+flight does not go to the network: it waits for the request in flight and
+receives the same `WooDataResponse`. The `data()` of a shared response is
+computed once, so all waiters also receive the same validated models, which
+should not be mutated.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one call per key at a time, sharing its result with the callers waiting on it.
+
+    Attributes:
+        calls (int): Number of calls made.
+        shared (int): Number of callers who received the result of another caller's call.
+
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._in_flight: dict[str, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Call `fn`, or wait for the call in flight with the same key.
+
+        Args:
+            key (str): Identifies identical calls.
+            fn (Callable[[], T]): The call to make.
+
+        Returns:
+            T: The result of the call, shared with all the callers of the same key.
+
+        Raises:
+            Exception: The exception raised by the call, to all its callers.
+
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as exc:  # noqa: BLE001
+            # Also on KeyboardInterrupt, so the waiters are not left blocked; re-raised by result() below
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
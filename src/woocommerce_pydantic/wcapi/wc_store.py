@@ -0,0 +1,203 @@
+"""
+Local SQLite mirror of validated resources.
+
+Each resource model gets a table holding the resource as JSON, plus indexed
+scalar columns for lookups, eg `id`, `status`, `customer_id`, `sku` and
+`date_modified_gmt`:
+
+    store = SQLiteStore("mirror.sqlite")
+    store.save(wcapi.get("orders").data().root)
+    orders = store.query(wc_resources.ShopOrder, status="processing", customer_id=23)
+
+The store is also a `wc_sync.Sink`, so a `SyncEngine` can keep it up to date.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from enum import Enum
+
+from pydantic_core import from_json
+
+from woocommerce_pydantic.wcapi.models import wc_construct, wc_resources
+
+# Scalar fields copied to indexed columns, when the model has them
+INDEXED_FIELDS = (
+    "status",
+    "customer_id",
+    "parent_id",
+    "product_id",
+    "order_id",
+    "sku",
+    "email",
+    "type",
+    "date_created_gmt",
+    "date_modified_gmt",
+)
+
+
+class SQLiteStore:
+    """
+    Persists resources into SQLite and hydrates them back into their models.
+
+    Args:
+        path (str): Path of the database file, ":memory:" by default.
+        trusted (bool): Hydrate models without validation, which is faster as
+            the stored data was validated before it was saved, see
+            `wc_construct.construct()`.
+
+    """
+
+    def __init__(self, path: str = ":memory:", *, trusted: bool = False) -> None:
+        self.path = path
+        self.trusted = trusted
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._lock = threading.RLock()
+        self._columns: dict[type, tuple[str, ...]] = {}
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+
+    def __enter__(self) -> SQLiteStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _table(self, model: type[wc_resources.WooCommerceResource]) -> tuple[str, ...]:
+        """Create the table of a model if needed, returning its indexed columns."""
+        if (columns := self._columns.get(model)) is not None:
+            return columns
+        if "id" not in model.model_fields:
+            msg = f"{model.__name__} has no id and cannot be stored."
+            raise ValueError(msg)
+        columns = tuple(name for name in INDEXED_FIELDS if name in model.model_fields)
+        with self._lock, self._connection:
+            definitions = "".join(f', "{column}"' for column in columns)
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{model.__name__}" '
+                f"(id NOT NULL PRIMARY KEY{definitions}, data TEXT NOT NULL)",
+            )
+            for column in columns:
+                self._connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{model.__name__}_{column}" ON "{model.__name__}" ("{column}")',
+                )
+        self._columns[model] = columns
+        return columns
+
+    def save(self, items: Iterable[wc_resources.WooCommerceResource]) -> int:
+        """
+        Insert or replace resources, in a single transaction.
+
+        Args:
+            items (Iterable[WooCommerceResource]): Resources with an `id`, of any models.
+
+        Returns:
+            int: The number of resources saved.
+
+        Raises:
+            ValueError: If a resource has no `id`, as it could not be replaced later.
+
+        """
+        rows: dict[type, list[tuple]] = {}
+        for item in items:
+            columns = self._table(type(item))
+            if item.id is None:
+                msg = f"{type(item).__name__} resources without an id cannot be stored."
+                raise ValueError(msg)
+            values = (_column_value(getattr(item, column)) for column in ("id", *columns))
+            rows.setdefault(type(item), []).append((*values, item.model_dump_json(by_alias=True, exclude_unset=True)))
+
+        with self._lock, self._connection:
+            for model, model_rows in rows.items():
+                placeholders = ", ".join("?" * len(model_rows[0]))
+                self._connection.executemany(
+                    f'INSERT OR REPLACE INTO "{model.__name__}" VALUES ({placeholders})',  # noqa: S608
+                    model_rows,
+                )
+        return sum(len(model_rows) for model_rows in rows.values())
+
+    def upsert(self, endpoint: str, items: list[wc_resources.WooCommerceResource]) -> None:  # noqa: ARG002
+        """Save resources received from a `wc_sync.SyncEngine`."""
+        self.save(items)
+
+    def delete(self, model: type[wc_resources.WooCommerceResource], ids: Iterable[int]) -> None:
+        self._table(model)
+        with self._lock, self._connection:
+            self._connection.executemany(f'DELETE FROM "{model.__name__}" WHERE id = ?', [(i,) for i in ids])  # noqa: S608
+
+    def get(
+        self,
+        model: type[wc_resources.WooCommerceResource],
+        item_id: int,
+    ) -> wc_resources.WooCommerceResource | None:
+        """Return a stored resource by id, or None."""
+        items = self.query(model, id=item_id)
+        return items[0] if items else None
+
+    def query(
+        self,
+        model: type[wc_resources.WooCommerceResource],
+        order_by: str | None = None,
+        limit: int | None = None,
+        **filters: object,
+    ) -> list[wc_resources.WooCommerceResource]:
+        """
+        Return the stored resources of a model matching the filters.
+
+        Args:
+            model (type[WooCommerceResource]): The resource model, eg ShopOrder.
+            order_by (str | None): Indexed column to sort by, prefixed with "-"
+                for descending order, eg "-date_modified_gmt".
+            limit (int | None): Maximum number of resources returned.
+            **filters: Equality filters on the indexed columns, eg status="completed".
+
+        Returns:
+            list[WooCommerceResource]: The hydrated resources.
+
+        Raises:
+            ValueError: If a filter or order_by is not an indexed column.
+
+        """
+        sql, parameters = self._select(model, "data", order_by, filters)
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        if self.trusted:
+            return [wc_construct.construct(model, from_json(data)) for (data,) in rows]
+        return [model.model_validate_json(data) for (data,) in rows]
+
+    def count(self, model: type[wc_resources.WooCommerceResource], **filters: object) -> int:
+        """Return the number of stored resources of a model matching the filters."""
+        sql, parameters = self._select(model, "COUNT(*)", None, filters)
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()[0]
+
+    def _select(
+        self,
+        model: type[wc_resources.WooCommerceResource],
+        expression: str,
+        order_by: str | None,
+        filters: dict[str, object],
+    ) -> tuple[str, list]:
+        columns = ("id", *self._table(model))
+        for column in (*filters, (order_by or "id").lstrip("-")):
+            if column not in columns:
+                msg = f"'{column}' is not an indexed column of {model.__name__}, use one of {columns}."
+                raise ValueError(msg)
+        sql = f'SELECT {expression} FROM "{model.__name__}"'  # noqa: S608
+        if filters:
+            sql += " WHERE " + " AND ".join(f'"{column}" = ?' for column in filters)
+        if order_by:
+            direction = "DESC" if order_by.startswith("-") else "ASC"
+            sql += f' ORDER BY "{order_by.lstrip("-")}" {direction}'
+        return sql, [_column_value(value) for value in filters.values()]
+
+
+def _column_value(value: object) -> object:
+    return value.value if isinstance(value, Enum) else value
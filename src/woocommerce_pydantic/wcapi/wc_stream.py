@@ -0,0 +1,153 @@
+"""
+Incremental splitting of a JSON array into its items.
+
+Collection responses are JSON arrays. `iter_array_items()` reads an array in
+chunks and yields the raw JSON of each item as soon as it is complete, so each
+item can be validated and released before the rest of the body is read:
+
+    response = wcapi.get("products", params={"per_page": 100}, stream=True)
+    for product in response.iter_data():
+        ...
+
+Only the item being read is held in memory, rather than the whole body, its
+parsed tree and the validated collection at once.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+
+# Bytes changing the state of the splitter outside and inside strings
+_STRUCTURE = re.compile(rb'["\[\]{},]')
+_STRING = re.compile(rb'["\\]')
+_OPEN = frozenset(b"[{")
+_WHITESPACE = b" \t\r\n"
+
+
+class ArraySplitter:
+    """Splits the chunks of a JSON array into the raw JSON of its items."""
+
+    def __init__(self) -> None:
+        # Nesting depth, 1 between the brackets of the top-level array
+        self.depth = 0
+        self.done = False
+        self._in_string = False
+        # Whether the previous chunk ended with a backslash inside a string
+        self._escape = False
+        # Parts of the item being read from the previous chunks
+        self._parts: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Read the next chunk of the array.
+
+        Args:
+            chunk (bytes): The next bytes of the JSON array.
+
+        Returns:
+            list[bytes]: The raw JSON of the items completed by the chunk.
+
+        Raises:
+            ValueError: If the JSON is not an array.
+
+        """
+        items: list[bytes] = []
+        # Start of the current item within the chunk
+        start = 0
+        position = 0
+        if self._escape and chunk:
+            self._escape = False
+            position = 1
+        while not self.done:
+            if self._in_string:
+                if (position := self._skip_string(chunk, position)) is None:
+                    break
+                continue
+            match = _STRUCTURE.search(chunk, position)
+            if match is None:
+                break
+            position = match.end()
+            start = self._read_structure(chunk, match.start(), start, items)
+        if self.depth > 0 and not self.done:
+            self._parts.append(chunk[start:])
+        return items
+
+    def _skip_string(self, chunk: bytes, position: int) -> int | None:
+        """Return the position following the string being read, or None if it continues in the next chunk."""
+        while (match := _STRING.search(chunk, position)) is not None:
+            position = match.end()
+            if match.group() == b'"':
+                self._in_string = False
+                return position
+            if position == len(chunk):
+                self._escape = True
+                return None
+            # Skip the escaped byte
+            position += 1
+        return None
+
+    def _read_structure(self, chunk: bytes, index: int, start: int, items: list[bytes]) -> int:
+        """
+        Track the nesting of the structural byte at `index` of the chunk.
+
+        Items completed by the byte are appended to `items`.
+
+        Returns:
+            int: The start of the current item within the chunk.
+
+        Raises:
+            ValueError: If the JSON is not an array.
+
+        """
+        byte = chunk[index]
+        if self.depth == 0:
+            if byte != ord("[") or chunk[start:index].strip(_WHITESPACE):
+                msg = "The JSON response is not an array."
+                raise ValueError(msg)
+            self.depth = 1
+            return index + 1
+        if byte == ord('"'):
+            self._in_string = True
+        elif byte in _OPEN:
+            self.depth += 1
+        elif byte == ord(","):
+            if self.depth == 1:
+                items.append(self._item(chunk[start:index]))
+                return index + 1
+        else:
+            self.depth -= 1
+            if self.depth == 0:
+                if item := self._item(chunk[start:index]):
+                    items.append(item)
+                self.done = True
+        return start
+
+    def _item(self, tail: bytes) -> bytes:
+        """Return the item ending with `tail`, and start the next one."""
+        item = b"".join((*self._parts, tail)).strip(_WHITESPACE)
+        self._parts = []
+        return item
+
+
+def iter_array_items(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Yield the raw JSON of each item of a JSON array, as soon as it has been read.
+
+    Args:
+        chunks (Iterable[bytes]): The JSON array, in chunks of any size.
+
+    Yields:
+        bytes: The raw JSON of each item, eg b'{"id": 794, ...}'.
+
+    Raises:
+        ValueError: If the JSON is not an array, or ends before the array.
+
+    """
+    splitter = ArraySplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+        if splitter.done:
+            return
+    if not splitter.done:
+        msg = "The JSON response ended before the end of the array."
+        raise ValueError(msg)
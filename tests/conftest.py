@@ -1,7 +1,45 @@
+from __future__ import annotations  # noqa: D100
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
 from dotenv import find_dotenv, load_dotenv
 
+from woocommerce_pydantic.wcapi.wc_api import API
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Loaded on import, so the test modules importing the constants below see it
+load_dotenv(find_dotenv(".env.tests"))
+
+WC_URL = os.environ.get("TEST_WC_URL", "http://example.com")
+WC_API_URL = f"{WC_URL}/wp-json/wc/v3"
+
+
+@pytest.fixture
+def make_wcapi() -> Iterator[Callable[..., API]]:
+    """Return a factory of API instances for the test store, closed after the test."""
+    apis = []
+
+    def make(**kwargs) -> API:  # noqa: ANN003
+        options = {
+            "url": WC_URL,
+            "consumer_key": os.environ.get("TEST_WC_KEY", "ck_XXXXXXXX"),
+            "consumer_secret": os.environ.get("TEST_WC_SECRET", "cs_XXXXXXXX"),
+            "version": "wc/v3",
+            **kwargs,
+        }
+        apis.append(API(**options))
+        return apis[-1]
+
+    yield make
+    for api in apis:
+        api.close()
+
 
-def pytest_configure() -> None:
-    """Pytest hook to configure the test environment."""
-    env_file = find_dotenv(".env.tests")
-    load_dotenv(env_file)
+@pytest.fixture
+def wcapi(make_wcapi: Callable[..., API]) -> API:
+    """Return an API instance for the test store."""
+    return make_wcapi()
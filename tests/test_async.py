@@ -0,0 +1,129 @@
+import asyncio  # noqa: D100
+import json
+
+import httpx
+import pytest
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.wc_async import AsyncAPI
+
+WC_URL = "http://example.com"
+
+
+def _orders_handler(request: httpx.Request) -> httpx.Response:
+    """Stand-in server for /orders with 3 pages of 2 orders and /orders/{id}."""
+    path = request.url.path.removeprefix("/wp-json/wc/v3/")
+    if path == "orders":
+        page = int(request.url.params["page"])
+        orders = [{"id": page * 10 + n} for n in range(2)]
+        return httpx.Response(200, json=orders, headers={"X-WP-TotalPages": "3"})
+    if path.startswith("orders/"):
+        return httpx.Response(200, json={"id": int(path.split("/")[1]), "status": "completed"})
+    return httpx.Response(404, json={"code": "rest_no_route"})
+
+
+def _wcapi(handler) -> AsyncAPI:  # noqa: ANN001
+    return AsyncAPI(
+        url=WC_URL,
+        consumer_key="ck_XXXXXXXX",
+        consumer_secret="cs_XXXXXXXX",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_get_data():
+    """/orders/{id}: wc_resources.ShopOrder"""  # noqa: D400, D415
+
+    async def run() -> wc_resources.ShopOrder:
+        async with _wcapi(_orders_handler) as wcapi:
+            response = await wcapi.get("orders/77")
+            assert response.status_code == 200
+            return response.data()
+
+    order = asyncio.run(run())
+    assert isinstance(order, wc_resources.ShopOrder)
+    assert order.id == 77
+
+
+def test_async_put_sends_json_with_oauth():
+    """Request bodies are sent as JSON and the URL is signed with OAuth over http."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = json.loads(request.content)
+        seen["params"] = request.url.params
+        return httpx.Response(200, json={"id": 5, **seen["body"]})
+
+    async def run() -> wc_resources.ShopOrder:
+        async with _wcapi(handler) as wcapi:
+            return (await wcapi.put("orders/5", {"status": "pending"})).data()
+
+    order = asyncio.run(run())
+    assert order.status == wc_resources.Status.pending
+    assert seen["body"] == {"status": "pending"}
+    assert "oauth_signature" in seen["params"]
+
+
+def test_async_iter_items_concurrently():
+    """Pages 2..N are fetched concurrently and items yielded in page order."""
+
+    async def run() -> list:
+        async with _wcapi(_orders_handler) as wcapi:
+            pages = [page async for page in wcapi.iter_pages("orders", per_page=2, concurrency=2)]
+            assert all(isinstance(page, wc_collections.ShopOrderList) for page in pages)
+            return [order.id async for order in wcapi.iter_items("orders", per_page=2, concurrency=2)]
+
+    assert asyncio.run(run()) == [10, 11, 20, 21, 30, 31]
+
+
+def test_async_deadline_cancels_request():
+    """A request exceeding its deadline is cancelled with TimeoutError."""
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return _orders_handler(request)
+
+    async def run() -> None:
+        async with _wcapi(slow_handler) as wcapi:
+            await wcapi.get("orders/77", deadline=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+
+
+def test_async_iter_pages_stopped_early_awaits_cancelled_requests():
+    """Closing the page iterator cancels the pages in flight and waits for them."""
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == "3":
+            await asyncio.sleep(1)
+        return _orders_handler(request)
+
+    async def run() -> list:
+        async with _wcapi(slow_handler) as wcapi:
+            pages = wcapi.iter_pages("orders", per_page=2, concurrency=2)
+            await pages.__anext__()
+            await pages.__anext__()
+            await pages.aclose()
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+
+
+def test_async_iter_items_stopped_early_cancels_requests():
+    """Closing the item iterator closes the page iterator, cancelling the pages in flight."""
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == "3":
+            await asyncio.sleep(1)
+        return _orders_handler(request)
+
+    async def run() -> list:
+        async with _wcapi(slow_handler) as wcapi:
+            items = wcapi.iter_items("orders", per_page=2, concurrency=2)
+            for _ in range(3):
+                await items.__anext__()
+            await items.aclose()
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
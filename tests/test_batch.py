@@ -0,0 +1,102 @@
+import json  # noqa: D100
+
+import pytest
+import requests
+import responses
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_resources
+from woocommerce_pydantic.wcapi.wc_batch import BatchWriter
+
+
+def _batch_callback(request):  # noqa: ANN001, ANN202
+    """Stand-in batch endpoint, failing updates of variation 13."""
+    body = json.loads(request.body)
+    assert sum(len(operations) for operations in body.values()) <= 100
+    result = {
+        "create": [{"id": 1000 + n, **item} for n, item in enumerate(body.get("create", []))],
+        "update": [
+            {
+                "id": 13,
+                "error": {"code": "woocommerce_rest_invalid_id", "message": "Invalid ID.", "data": {"status": 400}},
+            }
+            if item["id"] == 13
+            else item
+            for item in body.get("update", [])
+        ],
+        "delete": [{"id": item_id} for item_id in body.get("delete", [])],
+    }
+    return 200, {}, json.dumps(result)
+
+
+@responses.activate
+def test_batch_writer_chunks_and_collects_results(wcapi):
+    """Operations are split into chunks of 100 and results validated per item."""
+    responses.add_callback(responses.POST, f"{WC_API_URL}/products/12/variations/batch", callback=_batch_callback)
+    updates = [wc_resources.ProductVariation(id=n, regular_price="9.99") for n in range(1, 231)]
+
+    result = BatchWriter(wcapi, "products/12/variations", max_workers=3).run(
+        create=[{"regular_price": "1.00"}],
+        update=updates,
+        delete=[wc_resources.ProductVariation(id=500), 501],
+    )
+
+    assert len(responses.calls) == 3
+    assert [variation.id for variation in result.updated] == [n for n in range(1, 231) if n != 13]
+    assert isinstance(result.created[0], wc_resources.ProductVariation)
+    assert [variation.id for variation in result.deleted] == [500, 501]
+    assert len(result.errors) == 1
+    assert (result.errors[0].action, result.errors[0].id, result.errors[0].code) == (
+        "update",
+        13,
+        "woocommerce_rest_invalid_id",
+    )
+
+
+@responses.activate
+def test_batch_writer_keeps_results_of_chunks_sent_before_a_failure(wcapi):
+    """A chunk failing with a connection error is reported per item, and the other chunks' results are kept."""
+    responses.add_callback(responses.POST, f"{WC_API_URL}/products/batch", callback=_batch_callback)
+    responses.post(f"{WC_API_URL}/products/batch", body=requests.ConnectionError("Connection reset"))
+    updates = [wc_resources.Product(id=n, name="Renamed") for n in range(1, 151)]
+
+    result = BatchWriter(wcapi, "products", max_workers=1).run(update=updates)
+
+    assert [product.id for product in result.updated] == [n for n in range(1, 101) if n != 13]
+    assert [error.id for error in result.errors] == [13, *range(101, 151)]
+    assert {error.code for error in result.errors[1:]} == {"ConnectionError"}
+
+
+@responses.activate
+def test_batch_writer_reports_invalid_results_per_item(wcapi):
+    """Results failing validation and errors that are not objects are reported, keeping the other results."""
+    responses.post(
+        f"{WC_API_URL}/products/batch",
+        json={
+            "update": [
+                {"id": 1, "name": "Renamed"},
+                {"id": 2, "name": ["not", "a", "name"]},
+                {"id": 3, "error": "Sorry, you cannot update this product."},
+            ],
+        },
+    )
+
+    result = BatchWriter(wcapi, "products").run(update=[{"id": n, "name": "Renamed"} for n in (1, 2, 3)])
+
+    assert [product.id for product in result.updated] == [1]
+    assert [(error.id, error.code) for error in result.errors] == [(2, "ValidationError"), (3, "")]
+    assert result.errors[0].data == {"id": 2, "name": ["not", "a", "name"]}
+    assert result.errors[1].message == "Sorry, you cannot update this product."
+
+
+def test_batch_writer_resolves_the_model_for_the_api_version(make_wcapi):
+    """The item model is resolved from the API's own url and version."""
+    wcapi_v2 = make_wcapi(version="wc/v2")
+
+    assert BatchWriter(wcapi_v2, "orders").item_model is wc_resources.ShopOrder
+
+
+def test_batch_writer_requires_collection_endpoint(wcapi):
+    """Only collection endpoints have a batch endpoint."""
+    with pytest.raises(ValueError, match="not a collection endpoint"):
+        BatchWriter(wcapi, "orders/12")
@@ -0,0 +1,148 @@
+import pytest  # noqa: D100
+import responses
+from pydantic import ValidationError
+
+from tests.conftest import WC_API_URL, WC_URL
+from woocommerce_pydantic.wcapi.models import wc_collections
+from woocommerce_pydantic.wcapi.models.wc_instances import InstanceCache
+from woocommerce_pydantic.wcapi.wc_cache import MemoryCache, ResponseCache, SQLiteCache
+
+
+@responses.activate
+def test_memory_cache_normalises_params(make_wcapi):
+    """Repeated GETs with the same params, in any order, are served from the cache."""
+    responses.get(f"{WC_API_URL}/taxes", json=[{"id": 1, "rate": "20.0000"}])
+    wcapi = make_wcapi(cache=MemoryCache())
+
+    first = wcapi.get("taxes", params={"page": 1, "per_page": 10})
+    second = wcapi.get("taxes", params={"per_page": 10, "page": 1})
+    wcapi.get("taxes", params={"page": 2})
+
+    assert len(responses.calls) == 2
+    assert second.data() == first.data()
+    assert isinstance(second.data(), wc_collections.TaxList)
+
+
+@responses.activate
+def test_memory_cache_ttl_per_endpoint_and_lru(make_wcapi):
+    """Endpoints with a zero TTL are not cached, and the least recently used entry is evicted."""
+    responses.get(f"{WC_API_URL}/orders", json=[])
+    responses.get(f"{WC_API_URL}/data/countries", json=[])
+    responses.get(f"{WC_API_URL}/taxes", json=[])
+    wcapi = make_wcapi(cache=MemoryCache(ttls={"/orders": 0}, maxsize=1))
+
+    wcapi.get("orders")
+    wcapi.get("orders")
+    wcapi.get("data/countries")
+    wcapi.get("taxes")
+    wcapi.get("data/countries")
+
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_memory_cache_store_models(make_wcapi):
+    """A cache storing models returns the same validated instance."""
+    responses.get(f"{WC_API_URL}/payment_gateways", json=[{"id": "bacs", "enabled": True}])
+    wcapi = make_wcapi(cache=MemoryCache(store_models=True))
+
+    gateways = wcapi.get("payment_gateways").data()
+
+    assert wcapi.get("payment_gateways").data() is gateways
+    assert wcapi.get("payment_gateways").data(plain=True) is gateways.root
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_memory_cache_store_models_validates_on_data(make_wcapi):
+    """A cache storing models returns invalid responses as an uncached get() does, raising only from data()."""
+    responses.get(f"{WC_API_URL}/orders", json=[{"id": "not a number"}])
+    wcapi = make_wcapi(cache=MemoryCache(store_models=True))
+
+    response = wcapi.get("orders")
+
+    assert response.status_code == 200
+    with pytest.raises(ValidationError):
+        response.data()
+    with pytest.raises(ValidationError):
+        wcapi.get("orders").data()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_sqlite_cache_is_shared(tmp_path, make_wcapi):
+    """Separate SQLite caches on the same file, eg in two processes, share entries."""
+    responses.get(f"{WC_API_URL}/shipping/zones", json=[{"id": 0, "name": "Everywhere"}])
+    path = str(tmp_path / "cache.sqlite")
+
+    make_wcapi(cache=SQLiteCache(path)).get("shipping/zones")
+    zones = make_wcapi(cache=SQLiteCache(path)).get("shipping/zones").data()
+
+    assert len(responses.calls) == 1
+    assert zones.root[0].name == "Everywhere"
+
+
+@responses.activate
+def test_cache_keys_include_store_and_version(tmp_path, make_wcapi):
+    """Stores and API versions sharing a cache file do not get each other's responses."""
+    responses.get(f"{WC_API_URL}/taxes", json=[{"id": 1}])
+    responses.get(f"{WC_URL}/wp-json/wc/v2/taxes", json=[{"id": 2}])
+    responses.get("http://other.example.com/wp-json/wc/v3/taxes", json=[{"id": 3}])
+    path = str(tmp_path / "cache.sqlite")
+
+    def get(url: str, version: str) -> int:
+        wcapi = make_wcapi(url=url, version=version)
+        wcapi.cache = SQLiteCache(path)
+        return wcapi.get("taxes").data().root[0].id
+
+    assert [get(WC_URL, "wc/v3"), get(WC_URL, "wc/v2"), get("http://other.example.com", "wc/v3")] == [1, 2, 3]
+    assert get(WC_URL, "wc/v3") == 1
+    assert len(responses.calls) == 3
+
+
+def test_response_cache_is_abstract():
+    """ResponseCache only chooses keys and times to live, subclasses store the entries."""
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+@responses.activate
+def test_instance_cache_reuses_unchanged_items(make_wcapi):
+    """Only items whose date_modified_gmt moved are validated again."""
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[
+            {"id": 1, "date_modified_gmt": "2025-02-03T09:27:51", "status": "processing"},
+            {"id": 2, "date_modified_gmt": "2025-02-03T09:27:51", "status": "processing"},
+        ],
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[
+            {"id": 1, "date_modified_gmt": "2025-02-03T09:27:51", "status": "processing"},
+            {"id": 2, "date_modified_gmt": "2025-02-04T10:00:00", "status": "completed"},
+        ],
+    )
+    instance_cache = InstanceCache()
+    wcapi = make_wcapi(instance_cache=instance_cache)
+
+    first = wcapi.get("orders").data()
+    second = wcapi.get("orders").data()
+
+    assert isinstance(second, wc_collections.ShopOrderList)
+    assert second.root[0] is first.root[0]
+    assert second.root[1] is not first.root[1]
+    assert second.root[1].status.value == "completed"
+    assert (instance_cache.hits, instance_cache.misses) == (1, 3)
+
+
+@responses.activate
+def test_instance_cache_does_not_return_trusted_instances_to_validated_data(make_wcapi):
+    """Items built without validation are never reused by a validating data() call."""
+    responses.get(f"{WC_API_URL}/orders", json=[{"id": 1, "date_modified_gmt": "2025-02-03T09:27:51", "status": "?"}])
+    wcapi = make_wcapi(instance_cache=InstanceCache())
+    response = wcapi.get("orders")
+
+    assert response.data(trusted=True).root[0].status == "?"
+    with pytest.raises(ValidationError):
+        response.data()
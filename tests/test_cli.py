@@ -0,0 +1,81 @@
+import gzip  # noqa: D100
+import json
+
+import pytest
+import responses
+from responses import matchers
+
+from tests.conftest import WC_API_URL, WC_URL
+from woocommerce_pydantic.cli import main
+
+
+@pytest.fixture(autouse=True)
+def _credentials(monkeypatch):  # noqa: ANN001
+    monkeypatch.setenv("WC_URL", WC_URL)
+    monkeypatch.setenv("WC_CONSUMER_KEY", "ck_XXXXXXXX")
+    monkeypatch.setenv("WC_CONSUMER_SECRET", "cs_XXXXXXXX")
+
+
+def _mock_page(page: int, status: int = 200, total_pages: int = 3) -> None:
+    responses.get(
+        f"{WC_API_URL}/orders",
+        match=[matchers.query_param_matcher({"page": str(page)}, strict_match=False)],
+        status=status,
+        json=[{"id": page * 10}, {"id": page * 10 + 1}] if status == 200 else {"code": "error"},
+        headers={"X-WP-TotalPages": str(total_pages)},
+    )
+
+
+@responses.activate
+@pytest.mark.parametrize("filename", ["orders.ndjson", "orders.ndjson.gz"])
+def test_export_resumes_from_last_completed_page(tmp_path, filename):
+    """An interrupted export leaves a checkpoint, and running it again completes the output."""
+    output = tmp_path / filename
+    _mock_page(1)
+    _mock_page(2, status=400)
+
+    assert main(["export", "orders", "-o", str(output), "--since", "2025-01-01T00:00:00"]) == 1
+    checkpoint = json.loads((tmp_path / f"{filename}.checkpoint").read_text())
+    assert checkpoint["next_page"] == 2
+    assert "modified_after=2025-01-01T00%3A00%3A00" in responses.calls[0].request.url
+
+    responses.reset()
+    _mock_page(2)
+    _mock_page(3)
+    assert main(["export", "orders", "-o", str(output), "--since", "2025-01-01T00:00:00", "--concurrency", "2"]) == 0
+
+    content = gzip.decompress(output.read_bytes()) if filename.endswith(".gz") else output.read_bytes()
+    assert [json.loads(line)["id"] for line in content.splitlines()] == [10, 11, 20, 21, 30, 31]
+    assert not (tmp_path / f"{filename}.checkpoint").exists()
+    assert "page=2" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_export_checkpoints_the_page_fetched_after_skipped_empty_pages(tmp_path):
+    """The checkpoint follows the page numbers fetched, not a count of the pages written."""
+    output = tmp_path / "orders.ndjson"
+    _mock_page(1, total_pages=4)
+    responses.get(
+        f"{WC_API_URL}/orders",
+        match=[matchers.query_param_matcher({"page": "2"}, strict_match=False)],
+        json=[],
+        headers={"X-WP-TotalPages": "4"},
+    )
+    _mock_page(3, total_pages=4)
+    _mock_page(4, status=400, total_pages=4)
+
+    assert main(["export", "orders", "-o", str(output), "--concurrency", "2"]) == 1
+
+    checkpoint = json.loads((tmp_path / "orders.ndjson.checkpoint").read_text())
+    assert checkpoint["next_page"] == 4
+    assert [json.loads(line)["id"] for line in output.read_bytes().splitlines()] == [10, 11, 30, 31]
+
+
+def test_export_refuses_checkpoint_of_another_export(tmp_path):
+    """A checkpoint is only resumed by the same export."""
+    output = tmp_path / "orders.ndjson"
+    (tmp_path / "orders.ndjson.checkpoint").write_text(
+        json.dumps({"export": {"endpoint": "products", "params": {}, "fields": None}, "next_page": 2, "offset": 0}),
+    )
+
+    assert main(["export", "orders", "-o", str(output)]) == 2
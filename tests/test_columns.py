@@ -0,0 +1,56 @@
+from pathlib import Path  # noqa: D100
+
+import pytest
+
+from woocommerce_pydantic.wcapi.models import wc_collections
+
+np = pytest.importorskip("numpy")
+wc_columns = pytest.importorskip("woocommerce_pydantic.wcapi.models.wc_columns")
+
+ORDERS_FILE = Path(__file__).parent / "data" / "responses" / "v3" / "orders.json"
+
+
+@pytest.fixture
+def orders() -> wc_collections.ShopOrderList:
+    return wc_collections.ShopOrderList.model_validate_json(ORDERS_FILE.read_text())
+
+
+def test_to_columns_types(orders):
+    """Amounts, dates, enums and nested fields are converted to typed columns."""
+    columns = orders.to_columns(("id", "total", "date_created_gmt", "status", "billing.country", "customer_note"))
+
+    assert columns["id"].dtype == np.int64
+    assert columns["total"].dtype == np.float64
+    assert columns["total"].sum() == pytest.approx(sum(float(order.total) for order in orders.root))
+    assert columns["date_created_gmt"].dtype == np.dtype("datetime64[s]")
+    assert isinstance(columns["status"], wc_columns.Categorical)
+    assert list(columns["status"].decode()) == [order.status.value for order in orders.root]
+    assert list(columns["billing.country"]) == [order.billing.country for order in orders.root]
+    assert columns["customer_note"].dtype == object
+
+
+def test_to_columns_concatenates_pages(orders):
+    """Pages are converted one by one and concatenated, with missing values as NaN, NaT and -1."""
+    sparse = wc_collections.ShopOrderList.model_validate([{"id": 99, "total": "", "customer_id": None}])
+
+    columns = wc_columns.to_columns(iter([orders, sparse]), ("total", "customer_id", "date_paid", "status"))
+
+    assert len(columns["total"]) == len(orders.root) + 1
+    assert np.isnan(columns["total"][-1])
+    assert np.isnan(columns["customer_id"][-1])
+    assert np.isnat(columns["date_paid"][-1])
+    assert columns["status"].codes[-1] == -1
+    assert wc_columns.to_columns(iter([])) == {}
+    with pytest.raises(ValueError, match="not a field"):
+        orders.to_columns(("billing.missing",))
+
+
+def test_to_arrow(orders):
+    """Columns convert to an Arrow table, with categoricals as dictionary arrays."""
+    pa = pytest.importorskip("pyarrow")
+
+    table = wc_columns.to_arrow(orders.to_columns())
+
+    assert table.num_rows == len(orders.root)
+    assert pa.types.is_dictionary(table.schema.field("status").type)
+    assert table.column("status").to_pylist() == [order.status.value for order in orders.root]
@@ -0,0 +1,43 @@
+import pickle  # noqa: D100
+from pathlib import Path
+
+import pytest
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.models.wc_compact import from_compact, to_compact
+
+ORDERS_FILE = Path(__file__).parent / "data" / "responses" / "v3" / "orders.json"
+
+
+@pytest.fixture
+def orders() -> wc_collections.ShopOrderList:
+    return wc_collections.ShopOrderList.model_validate_json(ORDERS_FILE.read_text())
+
+
+def test_compact_orders_round_trip(orders):
+    """Compact orders read like the models, and convert back to equal models."""
+    compact = to_compact(orders)
+
+    assert isinstance(compact, tuple)
+    assert type(compact[0]).__name__ == "CompactShopOrder"
+    assert not hasattr(compact[0], "__dict__")
+    assert compact[0].billing.email == orders.root[0].billing.email
+    assert compact[0].status is orders.root[0].status
+    assert isinstance(compact[0].line_items, tuple)
+    assert from_compact(compact, wc_collections.ShopOrderList) == orders
+    assert compact[0].to_model().model_dump() == orders.root[0].model_dump()
+
+
+def test_compact_elides_unset_fields_and_is_read_only():
+    """Unset fields are not stored but read as their default, and compact resources cannot be changed."""
+    order = to_compact(wc_resources.ShopOrder(id=5, customer_note=None))
+
+    assert repr(order) == "CompactShopOrder(id=5)"
+    assert order.customer_note is None
+    assert order.line_items is None
+    with pytest.raises(AttributeError):
+        order.id = 6
+    with pytest.raises(AttributeError):
+        order.missing  # noqa: B018
+    assert pickle.loads(pickle.dumps(order)) == order  # noqa: S301
+    assert order.to_model().model_fields_set == {"id"}
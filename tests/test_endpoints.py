@@ -0,0 +1,122 @@
+import subprocess  # noqa: D100
+import sys
+
+import pytest
+
+from woocommerce_pydantic.wcapi import models
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_endpoints, wc_projection, wc_resources, wc_validators
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://example.com/wp-json/wc/v3/orders/12/notes",
+        "https://example.com/shop/blog/wp-json/wc/v3/orders/12/notes/",
+        "http://example.com/wc-api/v3/orders/12/notes?oauth_nonce=abc",
+        "http://example.com/?rest_route=/wc/v3/orders/12/notes",
+    ],
+)
+def test_resolve_endpoint_detects_api_prefix(url):
+    """The API prefix is found wherever WordPress is installed."""
+    match = wc_endpoints.resolve_endpoint(url)
+
+    assert match.model is wc_collections.OrderNoteList
+    assert match.template == "/orders/{order_id}/notes"
+    assert match.params == {"order_id": "12"}
+
+
+def test_resolve_endpoint_prefers_literal_segments():
+    """Literal segments win over path parameters at the same position."""
+    current = wc_endpoints.resolve_endpoint("http://example.com/wp-json/wc/v3/data/currencies/current")
+    currency = wc_endpoints.resolve_endpoint("http://example.com/wp-json/wc/v3/data/currencies/GBP")
+    attributes = wc_endpoints.get_endpoint_model("http://example.com/wp-json/wc/v3/products/attributes")
+
+    assert current.template == "/data/currencies/current"
+    assert currency.params == {"currency": "GBP"}
+    assert attributes is wc_collections.ProductAttributeList
+
+
+def test_every_template_resolves_to_its_model():
+    """Each RESPONSE_MODELS entry is reachable through the compiled router."""
+    for verb, routes in wc_endpoints.RESPONSE_MODELS.items():
+        for template, model in routes.items():
+            path = template.replace("{", "").replace("}", "")
+            match = wc_endpoints.resolve_endpoint(f"http://example.com/wp-json/wc/v3{path}", verb)
+            assert match.model is model, (verb, template)
+
+
+@pytest.mark.parametrize(
+    ("verb", "path"),
+    [
+        ("post", "products/batch"),
+        ("post", "orders/batch"),
+        ("put", "products/12/variations/batch"),
+    ],
+)
+def test_batch_endpoints_do_not_resolve_to_a_resource(verb, path):
+    """The "batch" segment is never bound to an id, so batch responses are not validated as one resource."""
+    assert wc_endpoints.get_endpoint_model(f"http://example.com/wp-json/wc/v3/{path}", verb) is None
+
+
+def test_unknown_endpoint():
+    """Unmapped paths and urls outside the API resolve to None."""
+    assert wc_endpoints.get_endpoint_model("http://example.com/wp-json/wc/v3/unknown") is None
+    assert wc_endpoints.get_endpoint_model("http://example.com/orders/1") is None
+    assert wc_endpoints.get_endpoint_model("http://example.com/wp-json/wc/v3/orders/1") is wc_resources.ShopOrder
+
+
+def test_validator_registry_caches_and_unwraps_collections():
+    """Validators are built once per model, with an optional plain list form."""
+    validator = wc_validators.get_validator(wc_collections.ShopOrderList)
+    plain_validator = wc_validators.get_validator(wc_collections.ShopOrderList, plain=True)
+
+    orders = plain_validator.validate_json(b'[{"id": 1}, {"id": 2}]')
+
+    assert validator is wc_validators.get_validator(wc_collections.ShopOrderList)
+    assert isinstance(validator.validate_json(b'[{"id": 1}]'), wc_collections.ShopOrderList)
+    assert isinstance(orders, list)
+    assert [order.id for order in orders] == [1, 2]
+    assert wc_validators.get_validator(wc_resources.ShopOrder, plain=True) is wc_validators.get_validator(
+        wc_resources.ShopOrder,
+    )
+
+
+def test_project_model_keeps_requested_fields():
+    """Projections keep only the requested fields, following nested paths."""
+    projection = wc_projection.project_model(
+        wc_collections.ShopOrderList,
+        ("id", "billing.email", "line_items.sku", "line_items.quantity"),
+    )
+    item_model = projection.item_model()
+
+    orders = projection.model_validate_json(
+        b'[{"id": 1, "billing": {"email": "a@example.com"}, "line_items": [{"sku": "x", "quantity": 2}]}]',
+    )
+
+    assert issubclass(projection, wc_collections.WooCommerceCollection)
+    assert set(item_model.model_fields) == {"id", "billing", "line_items"}
+    assert set(item_model.model_fields["billing"].annotation.__args__[0].model_fields) == {"email"}
+    assert orders.root[0].line_items[0].quantity == 2
+    reordered = ("line_items.quantity", "line_items.sku", "billing.email", "id")
+    assert wc_projection.project_model(wc_collections.ShopOrderList, reordered) is projection
+
+
+def test_models_package_returns_the_real_submodules():
+    """Submodules accessed through the package are the imported modules, not stand-ins."""
+    module = models.__getattr__("wc_resources")
+
+    assert module is sys.modules["woocommerce_pydantic.wcapi.models.wc_resources"]
+    assert module.ShopOrder is wc_resources.ShopOrder
+    with pytest.raises(AttributeError):
+        models.__getattr__("unknown")
+
+
+def test_api_import_does_not_import_the_models():
+    """Importing the API client leaves the model modules to be imported on first use."""
+    code = (
+        "import sys, woocommerce_pydantic.wcapi.wc_api; "
+        "print(sorted(name for name in sys.modules if name.startswith('woocommerce_pydantic.wcapi.models.')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,79 @@
+import pytest  # noqa: D100
+import responses
+
+from tests.conftest import WC_API_URL, WC_URL
+from woocommerce_pydantic.wcapi.models import wc_collections
+from woocommerce_pydantic.wcapi.wc_fanout import FanOut, Relation
+
+
+@responses.activate
+def test_join_orders_with_notes_and_refunds(make_wcapi):
+    """Each order is joined with its notes and refunds, in the order of the parents."""
+    for order_id in (1, 2):
+        responses.get(f"{WC_API_URL}/orders/{order_id}/notes", json=[{"id": order_id * 10, "note": "Paid"}])
+        responses.get(f"{WC_API_URL}/orders/{order_id}/refunds", json=[])
+    orders = wc_collections.ShopOrderList.model_validate([{"id": 1}, {"id": 2}])
+
+    joined = FanOut(make_wcapi(), max_workers=4).join(orders)
+
+    assert [item.parent.id for item in joined] == [1, 2]
+    assert [item.children["notes"].root[0].id for item in joined] == [10, 20]
+    assert isinstance(joined[0].children["refunds"], wc_collections.ShopOrderRefundList)
+    assert joined[0].children["refunds"].root == []
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_iter_pages_fetches_variations_of_variable_products_only(make_wcapi):
+    """Variations are fetched across their pages, and only for variable products."""
+    responses.get(
+        f"{WC_API_URL}/products",
+        json=[{"id": 7, "type": "variable"}, {"id": 8, "type": "simple"}],
+        headers={"X-WP-TotalPages": "1"},
+    )
+    responses.get(
+        f"{WC_API_URL}/products/7/variations",
+        match=[responses.matchers.query_param_matcher({"page": "1", "per_page": "2"}, strict_match=False)],
+        json=[{"id": 71}, {"id": 72}],
+        headers={"X-WP-TotalPages": "2"},
+    )
+    responses.get(
+        f"{WC_API_URL}/products/7/variations",
+        match=[responses.matchers.query_param_matcher({"page": "2", "per_page": "2"}, strict_match=False)],
+        json=[{"id": 73}],
+        headers={"X-WP-TotalPages": "2"},
+    )
+
+    pages = list(FanOut(make_wcapi(), per_page=2).iter_pages("products"))
+
+    variable, simple = pages[0]
+    assert [variation.id for variation in variable.children["variations"].root] == [71, 72, 73]
+    assert simple.children == {}
+
+
+def test_unknown_relations(make_wcapi):
+    """Parents without known sub-resources need explicit relations."""
+    customers = wc_collections.CustomerList.model_validate([{"id": 1}])
+
+    with pytest.raises(ValueError, match="No sub-resources"):
+        FanOut(make_wcapi()).join(customers)
+
+    with responses.RequestsMock() as mock:
+        mock.get(f"{WC_API_URL}/customers/1/downloads", json=[])
+        joined = FanOut(make_wcapi()).join(customers, [Relation("downloads", "customers/{id}/downloads")])
+    assert joined[0].children["downloads"].root == []
+
+
+@responses.activate
+def test_iter_pages_resolves_models_for_the_api_version(make_wcapi):
+    """Relations and empty child collections are resolved from the API's own version."""
+    wc_v2_url = f"{WC_URL}/wp-json/wc/v2"
+    responses.get(f"{wc_v2_url}/orders", json=[{"id": 1}])
+    responses.get(f"{wc_v2_url}/orders/1/notes", json=[])
+    responses.get(f"{wc_v2_url}/orders/1/refunds", json=[])
+    wcapi = make_wcapi(version="wc/v2")
+
+    (order,) = next(FanOut(wcapi).iter_pages("orders"))
+
+    assert isinstance(order.children["notes"], wc_collections.OrderNoteList)
+    assert order.children["refunds"].root == []
@@ -0,0 +1,22 @@
+import pytest  # noqa: D100
+import responses
+from pydantic import ValidationError
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+
+
+@responses.activate
+def test_data_lazy_validates_items_on_access(wcapi):
+    """data(lazy=True) only validates the items that are accessed."""
+    responses.get(f"{WC_API_URL}/products", json=[{"id": 1, "sku": "a"}, {"id": 2, "images": "not a list"}])
+
+    products = wcapi.get("products").data(lazy=True)
+
+    assert isinstance(products, wc_collections.LazyCollection)
+    assert len(products) == 2
+    assert isinstance(products[0], wc_resources.Product)
+    assert products[0] is products[0]
+    assert products.raw(1)["id"] == 2
+    with pytest.raises(ValidationError):
+        products[1]
@@ -0,0 +1,78 @@
+from __future__ import annotations  # noqa: D100
+
+import responses
+from responses import matchers
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+
+
+def _add_orders_page(page: int, ids: list[int], headers: dict | None = None) -> None:
+    """Register a mocked page of /orders containing orders with the given ids."""
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[{"id": order_id, "status": "processing"} for order_id in ids],
+        headers=headers or {},
+        match=[matchers.query_param_matcher({"page": str(page)}, strict_match=False)],
+    )
+
+
+@responses.activate
+def test_iter_pages_follows_total_pages_header(wcapi):
+    """Pages are requested until X-WP-TotalPages is reached."""
+    for page, ids in enumerate([[1, 2], [3, 4], [5]], start=1):
+        _add_orders_page(page, ids, headers={"X-WP-TotalPages": "3"})
+
+    pages = list(wcapi.iter_pages("orders", per_page=2))
+
+    assert len(pages) == 3
+    assert all(isinstance(page, wc_collections.ShopOrderList) for page in pages)
+    assert [order.id for order in pages[2].root] == [5]
+
+
+@responses.activate
+def test_iter_pages_follows_link_header(wcapi):
+    """Without X-WP-TotalPages, the rel="next" Link header is followed."""
+    _add_orders_page(1, [1, 2], headers={"Link": f'<{WC_API_URL}/orders?page=2>; rel="next"'})
+    _add_orders_page(2, [3])
+
+    pages = list(wcapi.iter_pages("orders", per_page=2))
+
+    assert len(pages) == 2
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iter_items_deduplicates_shifted_rows(wcapi):
+    """Items that shift onto the next page during the walk are only yielded once."""
+    _add_orders_page(1, [10, 9], headers={"X-WP-TotalPages": "2"})
+    _add_orders_page(2, [9, 8], headers={"X-WP-TotalPages": "2"})
+
+    orders = list(wcapi.iter_items("orders", per_page=2))
+
+    assert [order.id for order in orders] == [10, 9, 8]
+    assert all(isinstance(order, wc_resources.ShopOrder) for order in orders)
+
+
+@responses.activate
+def test_iter_pages_concurrently_keeps_page_order(wcapi):
+    """With several workers, pages 2..N are fetched concurrently but yielded in page order."""
+    for page in range(1, 6):
+        _add_orders_page(page, [page * 10, page * 10 + 1], headers={"X-WP-TotalPages": "5"})
+
+    pages = list(wcapi.iter_pages("orders", per_page=2, workers=3))
+
+    assert [page.root[0].id for page in pages] == [10, 20, 30, 40, 50]
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_iter_items_concurrently_in_completion_order(wcapi):
+    """Completion order yields every item, whatever order the pages finish in."""
+    for page in range(1, 4):
+        _add_orders_page(page, [page], headers={"X-WP-TotalPages": "3"})
+
+    orders = list(wcapi.iter_items("orders", per_page=1, workers=2, ordered=False))
+
+    assert orders[0].id == 1
+    assert sorted(order.id for order in orders) == [1, 2, 3]
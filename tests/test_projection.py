@@ -0,0 +1,15 @@
+import responses  # noqa: D100
+
+from tests.conftest import WC_API_URL
+
+
+@responses.activate
+def test_get_fields_sends_fields_and_projects_model(wcapi):
+    """get(fields=...) sends `_fields` and data() validates into the projection."""
+    responses.get(f"{WC_API_URL}/products/1", json={"id": 1, "sku": "abc"})
+
+    product = wcapi.get("products/1", fields=["id", "sku"]).data()
+
+    assert "_fields=id%2Csku" in responses.calls[0].request.url
+    assert set(type(product).model_fields) == {"id", "sku"}
+    assert product.sku == "abc"
@@ -0,0 +1,119 @@
+import time  # noqa: D100
+
+import responses
+
+from tests.conftest import WC_API_URL, WC_URL
+from woocommerce_pydantic.wcapi.wc_ratelimit import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_aimd_backs_off_on_throttling_and_ramps_up():
+    """Concurrency halves on a 429, once per round, and grows by about one per round of successes."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=None, initial_concurrency=8, clock=clock)
+
+    for status_code in (429, 429):
+        limiter.acquire()
+        limiter.release(status_code, latency=0.1)
+    assert limiter.concurrency == 4
+
+    clock.now += 1
+    for _ in range(8):
+        limiter.acquire()
+        limiter.release(200, latency=0.1)
+    assert 5.5 < limiter.concurrency < 6.5
+
+
+def test_latency_growth_backs_off():
+    """Latency well above the lowest seen is treated as overload."""
+    limiter = RateLimiter(rate=None, initial_concurrency=8, latency_factor=3, clock=FakeClock())
+    limiter.acquire()
+    limiter.release(200, latency=0.1)
+    limiter.acquire()
+    limiter.release(200, latency=1.0)
+
+    assert limiter.concurrency < 8
+
+
+def test_mixed_latencies_do_not_back_off():
+    """Latency is compared to a moving average, so alternating small and large requests are not overload."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=None, initial_concurrency=8, latency_factor=3, clock=clock)
+
+    def send(latency: float) -> None:
+        clock.now += 1
+        limiter.acquire()
+        limiter.release(200, latency=latency)
+
+    for latency in (0.1, 0.5) * 10:
+        send(latency)
+    concurrency = limiter.concurrency
+    for latency in (0.1, 0.5) * 10:
+        send(latency)
+        assert limiter.concurrency > concurrency
+        concurrency = limiter.concurrency
+
+    assert 0.1 < limiter.baseline_latency < 0.5
+    send(5.0)
+    assert limiter.concurrency < concurrency
+
+
+def test_token_bucket_limits_rate():
+    """Beyond the burst, requests are spaced at the configured rate."""
+    limiter = RateLimiter(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+        limiter.release(200, latency=0.001)
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_parse_retry_after():
+    """Retry-After is accepted in seconds or as an HTTP date."""
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+@responses.activate
+def test_api_honours_retry_after(make_wcapi):
+    """A 429 with Retry-After pauses every request through the API's limiter."""
+    responses.get(f"{WC_API_URL}/orders", status=429, headers={"Retry-After": "0.2"}, json={})
+    responses.get(f"{WC_API_URL}/orders", json=[])
+    limiter = RateLimiter(rate=None)
+    wcapi = make_wcapi(max_retries=0, rate_limiter=limiter)
+
+    assert wcapi.get("orders").status_code == 429
+    started = time.monotonic()
+    assert wcapi.get("orders").status_code == 200
+
+    assert time.monotonic() - started >= 0.15
+    assert limiter.in_flight == 0
+
+
+@responses.activate
+def test_api_retries_throttled_responses_through_the_limiter(make_wcapi):
+    """With the default retries, the limiter sees each 429, backs off, and the API retries after Retry-After."""
+    responses.get(f"{WC_API_URL}/orders", status=429, headers={"Retry-After": "0.2"}, json={})
+    responses.get(f"{WC_API_URL}/orders", json=[])
+    limiter = RateLimiter(rate=None, initial_concurrency=8)
+    wcapi = make_wcapi(rate_limiter=limiter)
+
+    started = time.monotonic()
+    assert wcapi.get("orders").status_code == 200
+
+    assert time.monotonic() - started >= 0.15
+    assert len(responses.calls) == 2
+    assert limiter.concurrency < 8
+    assert limiter.in_flight == 0
+    assert 429 not in wcapi.session.get_adapter(WC_URL).max_retries.status_forcelist
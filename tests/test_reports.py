@@ -0,0 +1,102 @@
+from datetime import date  # noqa: D100
+
+import pytest
+
+from woocommerce_pydantic.wcapi.models import wc_resources
+from woocommerce_pydantic.wcapi.wc_reports import ReportEngine
+
+
+def _order(order_id: int, day: str, status: str = "completed", total: str = "10.00", **kwargs):  # noqa: ANN202
+    return wc_resources.ShopOrder.model_validate(
+        {
+            "id": order_id,
+            "status": status,
+            "date_created": f"{day}T10:00:00",
+            "total": total,
+            "total_tax": "1.00",
+            "shipping_total": "2.00",
+            "customer_id": order_id % 2 + 1,
+            "line_items": [{"product_id": 7, "name": "Shirt", "quantity": 2}, {"product_id": 8, "quantity": 1}],
+            **kwargs,
+        },
+    )
+
+
+@pytest.fixture
+def engine() -> ReportEngine:
+    engine = ReportEngine()
+    engine.add_orders(
+        [
+            _order(1, "2025-01-06"),
+            _order(2, "2025-01-07", refunds=[{"id": 9, "total": "-4.00"}], coupon_lines=[{"code": "TEN"}]),
+            _order(3, "2025-02-03", status="processing", total="20.00"),
+            _order(4, "2025-02-04", status="cancelled"),
+        ],
+    )
+    return engine
+
+
+def test_sales_report(engine):
+    """The sales report sums the orders counted as sales in the period, net of refunds."""
+    report = engine.sales(date_min=date(2025, 1, 1), date_max=date(2025, 1, 31))
+
+    assert report.total_sales == "16.00"
+    assert report.net_sales == "10.00"
+    assert report.average_sales == "0.32"
+    assert (report.total_orders, report.total_items, report.total_refunds, report.total_discount) == (2, 6, 1, 1)
+    assert engine.sales().total_orders == 3
+
+
+def test_sales_totals_grouping_and_updates(engine):
+    """Totals are grouped by period, and replaced when an order is updated."""
+    totals = engine.sales_totals(group_by="month")
+    assert list(totals) == ["2025-01", "2025-02"]
+    assert totals["2025-01"].sales == 16
+    assert totals["2025-01"].customers == 2
+
+    assert list(engine.sales_totals(group_by="week")) == ["2025-01-06", "2025-02-03"]
+
+    engine.add_orders([_order(3, "2025-02-03", status="cancelled")])
+    assert list(engine.sales_totals(group_by="month")) == ["2025-01"]
+    with pytest.raises(ValueError, match="Unknown grouping"):
+        engine.sales_totals(group_by="hour")
+
+
+def test_sales_totals_skip_guests_and_invalid_amounts():
+    """Guest orders are not counted as a customer, and empty or non-numeric totals count as 0."""
+    engine = ReportEngine()
+    engine.add_orders(
+        [
+            _order(1, "2025-01-06", customer_id=0),
+            _order(2, "2025-01-07", customer_id=0, total=""),
+            _order(3, "2025-01-08", customer_id=5, total="n/a", total_tax="NaN"),
+        ],
+    )
+
+    totals = engine.sales_totals(group_by="month")["2025-01"]
+
+    assert totals.customers == 1
+    assert totals.orders == 3
+    assert totals.sales == 10
+    assert totals.tax == 2
+
+
+def test_top_sellers_and_totals(engine):
+    """Top sellers rank products by quantity, and totals count orders, products and customers."""
+    engine.add_products([wc_resources.Product(id=8, name="Mug", type="simple")])
+
+    top_sellers = engine.top_sellers(limit=2).root
+    assert [(seller.product_id, seller.name, seller.quantity) for seller in top_sellers] == [
+        (7, "Shirt", 6),
+        (8, "Mug", 3),
+    ]
+
+    order_totals = {total.slug: total.total for total in engine.order_totals().root}
+    assert order_totals["completed"] == "2"
+    assert order_totals["cancelled"] == "1"
+    assert {total.slug: total.total for total in engine.product_totals().root}["simple"] == "1"
+
+    engine.remove_orders([1])
+    engine.add_customers([wc_resources.Customer(id=5, is_paying_customer=False)])
+    customers = {total.slug: total.total for total in engine.customer_totals().root}
+    assert customers == {"paying": "2", "non_paying": "1"}
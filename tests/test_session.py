@@ -0,0 +1,40 @@
+import responses  # noqa: D100
+from requests import Session
+
+from tests.conftest import WC_API_URL
+
+
+class CountingSession(Session):
+    """Session recording how many requests were sent through it."""
+
+    requests_sent = 0
+
+    def request(self, *args, **kwargs):  # noqa: ANN002, ANN003
+        self.requests_sent += 1
+        return super().request(*args, **kwargs)
+
+
+@responses.activate
+def test_all_verbs_share_the_pooled_session(make_wcapi):
+    """Every verb is sent through the single session of the API instance."""
+    responses.get(f"{WC_API_URL}/orders/1", json={"id": 1})
+    responses.put(f"{WC_API_URL}/orders/1", json={"id": 1})
+    responses.delete(f"{WC_API_URL}/orders/1", json={"id": 1})
+    session = CountingSession()
+
+    with make_wcapi(session=session) as wcapi:
+        wcapi.get("orders/1")
+        wcapi.put("orders/1", {"status": "completed"})
+        wcapi.delete("orders/1")
+
+    assert session.requests_sent == 3
+    assert "oauth_signature" in responses.calls[0].request.url
+
+
+def test_session_adapter_pool_configuration(make_wcapi):
+    """Pool size and retries are mounted on the session's adapters."""
+    wcapi = make_wcapi(pool_maxsize=32, max_retries=5)
+    adapter = wcapi.session.get_adapter(WC_API_URL)
+
+    assert adapter._pool_maxsize == 32  # noqa: SLF001
+    assert adapter.max_retries.total == 5
@@ -0,0 +1,69 @@
+import threading  # noqa: D100
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.wc_singleflight import SingleFlight
+
+
+def _slow_callback(body: str):  # noqa: ANN202
+    def callback(request):  # noqa: ANN001, ANN202, ARG001
+        time.sleep(0.2)
+        return 200, {}, body
+
+    return callback
+
+
+def test_single_flight_shares_result_and_exceptions():
+    """Concurrent calls with the same key run once, and all receive its result or exception."""
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn() -> object:
+        calls.append(1)
+        release.wait(1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(group.do, "key", fn) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.shared == 3
+
+    def fail() -> None:
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        group.do("key", fail)
+
+
+@responses.activate
+def test_api_coalesces_identical_gets(make_wcapi):
+    """Identical concurrent GETs send one request and share the response and its validated data."""
+    responses.add_callback(
+        responses.GET,
+        f"{WC_API_URL}/orders/5",
+        callback=_slow_callback('{"id": 5, "status": "processing"}'),
+    )
+    wcapi = make_wcapi(coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        fetched = list(executor.map(lambda _: wcapi.get("orders/5"), range(4)))
+        orders = list(executor.map(lambda response: response.data(), fetched))
+
+    assert len(responses.calls) == 1
+    assert all(response is fetched[0] for response in fetched)
+    assert all(order is orders[0] for order in orders)
+    assert orders[0].id == 5
+
+    # Requests sent after the first completed are not coalesced with it
+    wcapi.get("orders/5")
+    assert len(responses.calls) == 2
@@ -0,0 +1,91 @@
+import json  # noqa: D100
+import sqlite3
+import warnings
+
+import pytest
+
+from woocommerce_pydantic.wcapi.models import wc_collections, wc_resources
+from woocommerce_pydantic.wcapi.wc_store import SQLiteStore
+
+
+def _orders() -> wc_collections.ShopOrderList:
+    with open("tests/data/responses/v3/orders.json") as f:  # noqa: PTH123
+        return wc_collections.ShopOrderList(json.load(f))
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_store_round_trip(tmp_path, trusted):
+    """Saved resources are hydrated back into equal models."""
+    orders = _orders()
+    with SQLiteStore(str(tmp_path / "mirror.sqlite"), trusted=trusted) as store:
+        assert store.save(orders.root) == 2
+        assert store.save(orders.root) == 2
+
+        stored = store.get(wc_resources.ShopOrder, orders.root[0].id)
+
+        assert stored == orders.root[0]
+        assert store.count(wc_resources.ShopOrder) == 2
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_store_round_trip_products(tmp_path, trusted):
+    """Saved products, including their URL fields, are hydrated back into equal models."""
+    product = wc_resources.Product.model_validate(
+        {
+            "id": 7,
+            "permalink": "https://example.com/product/hoodie/",
+            "images": [{"id": 3, "src": "https://example.com/wp-content/uploads/hoodie.jpg"}],
+        },
+    )
+    with SQLiteStore(str(tmp_path / "mirror.sqlite"), trusted=trusted) as store:
+        store.save([product])
+
+        stored = store.get(wc_resources.Product, 7)
+
+        assert stored == product
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert store.save([stored]) == 1
+
+
+def test_store_query_indexed_columns():
+    """Queries filter and sort on indexed columns, including enums."""
+    store = SQLiteStore()
+    store.save(
+        [
+            wc_resources.ShopOrder(id=1, status="processing", customer_id=5, date_modified_gmt="2025-01-01T00:00:00"),
+            wc_resources.ShopOrder(id=2, status="completed", customer_id=5, date_modified_gmt="2025-01-02T00:00:00"),
+            wc_resources.ShopOrder(id=3, status="completed", customer_id=6, date_modified_gmt="2025-01-03T00:00:00"),
+            wc_resources.Product(id=3, sku="abc"),
+        ],
+    )
+
+    completed = store.query(wc_resources.ShopOrder, status=wc_resources.Status.completed, order_by="-date_modified_gmt")
+
+    assert [order.id for order in completed] == [3, 2]
+    assert store.count(wc_resources.ShopOrder, customer_id=5) == 2
+    assert store.query(wc_resources.Product, sku="abc")[0].id == 3
+    with pytest.raises(ValueError, match="not an indexed column"):
+        store.query(wc_resources.ShopOrder, total="10.00")
+
+
+def test_store_rejects_resources_without_id():
+    """Resources without an id are rejected, rather than stored as rows that are never replaced."""
+    store = SQLiteStore()
+
+    with pytest.raises(ValueError, match="without an id"):
+        store.save([wc_resources.ShopOrder(id=1), wc_resources.ShopOrder(status="pending")])
+
+    assert store.count(wc_resources.ShopOrder) == 0
+    with pytest.raises(sqlite3.IntegrityError):
+        store._connection.execute('INSERT INTO "ShopOrder" (id, data) VALUES (NULL, "{}")')  # noqa: SLF001
+
+
+def test_store_keeps_string_ids():
+    """Resources with string ids, eg payment gateways, are stored and replaced by id."""
+    store = SQLiteStore()
+    store.save([wc_resources.PaymentGateway(id="bacs", enabled=False)])
+    store.save([wc_resources.PaymentGateway(id="bacs", enabled=True)])
+
+    assert store.get(wc_resources.PaymentGateway, "bacs").enabled is True
+    assert store.count(wc_resources.PaymentGateway) == 1
@@ -0,0 +1,47 @@
+import json  # noqa: D100
+
+import pytest
+import responses
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_resources
+from woocommerce_pydantic.wcapi.wc_stream import iter_array_items
+
+ITEMS = [
+    {"id": 1, "name": 'Shirt, "blue" [L]', "description": "<p>{50% off}</p>\\", "tags": [{"id": 2}, {"id": 3}]},
+    {"id": 2, "name": "", "meta_data": [{"key": "k", "value": {"a": [1, 2, {"b": "]}"}]}}]},
+    17,
+    "text",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10_000])
+def test_iter_array_items_splits_at_any_chunk_size(chunk_size):
+    """Items are split correctly whatever the chunk boundaries, including inside strings and escapes."""
+    content = b" \n" + json.dumps(ITEMS, indent=1).encode()
+    chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+    assert [json.loads(item) for item in iter_array_items(chunks)] == ITEMS
+
+
+def test_iter_array_items_rejects_non_arrays():
+    """Objects and truncated arrays are errors."""
+    with pytest.raises(ValueError, match="not an array"):
+        list(iter_array_items([b'{"code": "rest_forbidden"}']))
+    with pytest.raises(ValueError, match="ended before"):
+        list(iter_array_items([b'[{"id": 1}, {"id"']))
+    assert list(iter_array_items([b" [ ] "])) == []
+
+
+@responses.activate
+def test_iter_data_streams_validated_items(wcapi):
+    """A streamed collection response yields each validated item."""
+    responses.get(f"{WC_API_URL}/products", json=ITEMS[:2])
+
+    response = wcapi.get("products", stream=True)
+    products = list(response.iter_data(chunk_size=16))
+
+    assert all(isinstance(product, wc_resources.Product) for product in products)
+    assert products[0].name == 'Shirt, "blue" [L]'
+    assert products[1].meta_data[0].key == "k"
+    assert list(wcapi.get("products", stream=True).iter_data(trusted=True)) == products
@@ -0,0 +1,138 @@
+from __future__ import annotations  # noqa: D100
+
+from datetime import timedelta
+
+import responses
+from responses import matchers
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_resources
+from woocommerce_pydantic.wcapi.wc_sync import CallbackSink, Checkpoint, JSONCheckpointStore, SyncEngine
+
+
+def _order(order_id: int, modified_gmt: str) -> dict:
+    return {"id": order_id, "date_modified_gmt": modified_gmt}
+
+
+@responses.activate
+def test_sync_resumes_from_checkpoint_with_overlap(tmp_path, wcapi):
+    """The second sync starts at the checkpoint minus the overlap and skips records already seen."""
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(1, "2025-02-03T09:00:00"), _order(2, "2025-02-03T10:00:00")],
+        match=[matchers.query_param_matcher({"orderby": "modified", "order": "asc"}, strict_match=False)],
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(2, "2025-02-03T10:00:00"), _order(3, "2025-02-03T09:58:00"), _order(1, "2025-02-03T10:05:00")],
+        match=[matchers.query_param_matcher({"modified_after": "2025-02-03T09:55:00"}, strict_match=False)],
+    )
+    upserts = []
+    store = JSONCheckpointStore(tmp_path / "checkpoints.json")
+
+    def engine() -> SyncEngine:
+        return SyncEngine(wcapi, CallbackSink(lambda _, items: upserts.extend(items)), store, timedelta(minutes=5))
+
+    assert engine().sync("orders") == 2
+    assert engine().sync("orders") == 2
+
+    assert [order.id for order in upserts] == [1, 2, 3, 1]
+    assert all(isinstance(order, wc_resources.ShopOrder) for order in upserts)
+    checkpoint = store.load("orders")
+    assert checkpoint.modified_gmt == "2025-02-03T10:05:00"
+    assert checkpoint.recent == {1: "2025-02-03T10:05:00", 2: "2025-02-03T10:00:00"}
+
+
+def _page_matcher(modified_after: str | None = None, exclude: str | None = None) -> list:
+    params = {"orderby": "modified", "order": "asc", "dates_are_gmt": "true", "per_page": "2"}
+    if modified_after is not None:
+        params["modified_after"] = modified_after
+    if exclude is not None:
+        params["exclude"] = exclude
+
+    def match(request) -> tuple[bool, str]:
+        # Ignore the oauth parameters of plain http urls
+        query = {key: value for key, value in request.params.items() if not key.startswith("oauth_")}
+        return query == params, f"{query} doesn't match {params}"
+
+    return [match]
+
+
+@responses.activate
+def test_sync_does_not_skip_records_shifted_by_a_modification(wcapi):
+    """Each page is requested from the new checkpoint, so a record modified mid-walk does not shift others away."""
+    # Order 1 is modified after the first page, moving to the end of the results
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(1, "2025-02-03T09:00:00"), _order(2, "2025-02-03T09:01:00")],
+        match=_page_matcher(),
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(3, "2025-02-03T09:02:00"), _order(4, "2025-02-03T09:03:00")],
+        match=_page_matcher("2025-02-03T09:00:59", "2"),
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(5, "2025-02-03T09:04:00"), _order(1, "2025-02-03T10:00:00")],
+        match=_page_matcher("2025-02-03T09:02:59", "4"),
+    )
+    responses.get(f"{WC_API_URL}/orders", json=[], match=_page_matcher("2025-02-03T09:59:59", "1"))
+    upserts = []
+    engine = SyncEngine(wcapi, CallbackSink(lambda _, items: upserts.extend(items)), overlap=timedelta(0), per_page=2)
+
+    assert engine.sync("orders") == 6
+
+    assert [order.id for order in upserts] == [1, 2, 3, 4, 5, 1]
+    assert engine.checkpoints.load("orders").modified_gmt == "2025-02-03T10:00:00"
+
+
+@responses.activate
+def test_sync_applies_the_overlap_to_the_first_page_only(wcapi):
+    """After a full page of the overlap, the walk continues from the high-water mark instead of the overlap."""
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(1, "2025-02-03T09:00:00"), _order(2, "2025-02-03T09:01:00")],
+        match=_page_matcher("2025-02-03T08:56:00"),
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(3, "2025-02-03T09:02:00")],
+        match=_page_matcher("2025-02-03T09:00:59", "2"),
+    )
+    upserts = []
+    engine = SyncEngine(wcapi, CallbackSink(lambda _, items: upserts.extend(items)), per_page=2)
+    checkpoint = Checkpoint("2025-02-03T09:01:00", {1: "2025-02-03T09:00:00", 2: "2025-02-03T09:01:00"})
+    engine.checkpoints.save("orders", checkpoint)
+
+    assert engine.sync("orders") == 1
+
+    assert [order.id for order in upserts] == [3]
+    assert engine.checkpoints.load("orders").modified_gmt == "2025-02-03T09:02:00"
+
+
+@responses.activate
+def test_sync_pages_through_more_records_than_a_page_sharing_a_timestamp(wcapi):
+    """Records sharing the high-water mark are paged through by id, even without an overlap."""
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(1, "2025-02-03T09:00:00"), _order(2, "2025-02-03T09:00:00")],
+        match=_page_matcher(),
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(3, "2025-02-03T09:00:00"), _order(4, "2025-02-03T09:00:00")],
+        match=_page_matcher("2025-02-03T08:59:59", "1,2"),
+    )
+    responses.get(
+        f"{WC_API_URL}/orders",
+        json=[_order(5, "2025-02-03T09:00:00")],
+        match=_page_matcher("2025-02-03T08:59:59", "1,2,3,4"),
+    )
+    upserts = []
+    engine = SyncEngine(wcapi, CallbackSink(lambda _, items: upserts.extend(items)), overlap=timedelta(0), per_page=2)
+
+    assert engine.sync("orders") == 5
+
+    assert [order.id for order in upserts] == [1, 2, 3, 4, 5]
+    assert engine.checkpoints.load("orders").recent == dict.fromkeys(range(1, 6), "2025-02-03T09:00:00")
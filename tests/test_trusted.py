@@ -0,0 +1,55 @@
+import json  # noqa: D100
+import warnings
+
+import pytest
+import responses
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_resources
+
+PRODUCTS = [
+    {
+        "id": 7,
+        "type": "external",
+        "status": "publish",
+        "permalink": "https://example.com/product/hoodie/",
+        "external_url": "https://example.org/hoodie",
+        "images": [{"id": 3, "src": "https://example.com/wp-content/uploads/hoodie.jpg"}],
+    },
+]
+
+
+def _orders_body() -> bytes:
+    with open("tests/data/responses/v3/orders.json", "rb") as f:  # noqa: PTH123
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "body"),
+    [("orders", _orders_body()), ("products", json.dumps(PRODUCTS))],
+    ids=["orders", "products"],
+)
+@responses.activate
+def test_trusted_data_matches_validated_data(make_wcapi, endpoint, body):
+    """Trusted construction builds the same nested models, enums and URLs as validation."""
+    responses.get(f"{WC_API_URL}/{endpoint}", body=body)
+
+    validated = make_wcapi().get(endpoint).data()
+    trusted = make_wcapi(trusted=True).get(endpoint).data()
+
+    assert trusted == validated
+    assert trusted.root[0].model_fields_set == validated.root[0].model_fields_set
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+@responses.activate
+def test_trusted_data_builds_nested_models_and_enums(make_wcapi):
+    """Trusted orders hold the nested models and enum members validation would."""
+    responses.get(f"{WC_API_URL}/orders", body=_orders_body())
+
+    trusted = make_wcapi(trusted=True).get("orders").data()
+
+    assert isinstance(trusted.root[0].line_items[0], wc_resources.LineItem1)
+    assert trusted.root[0].status is wc_resources.Status.processing
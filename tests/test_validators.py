@@ -0,0 +1,14 @@
+import responses  # noqa: D100
+
+from tests.conftest import WC_API_URL
+
+
+@responses.activate
+def test_data_plain_returns_list_of_items(wcapi):
+    """data(plain=True) returns the items without the collection wrapper."""
+    responses.get(f"{WC_API_URL}/orders", json=[{"id": 1}, {"id": 2}])
+
+    orders = wcapi.get("orders").data(plain=True)
+
+    assert isinstance(orders, list)
+    assert [order.id for order in orders] == [1, 2]
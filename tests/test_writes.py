@@ -0,0 +1,55 @@
+import json  # noqa: D100
+
+import pytest
+import responses
+
+from tests.conftest import WC_API_URL
+from woocommerce_pydantic.wcapi.models import wc_resources
+
+
+@responses.activate
+def test_post_model_body_and_typed_response(wcapi):
+    """Models are sent with only their set fields, and POST responses map to the created resource."""
+    responses.post(f"{WC_API_URL}/orders", json={"id": 99, "status": "pending", "customer_id": 5}, status=201)
+
+    order = wcapi.post("orders", wc_resources.ShopOrder(status="pending", customer_id=5)).data()
+
+    assert json.loads(responses.calls[0].request.body) == {"status": "pending", "customer_id": 5}
+    assert isinstance(order, wc_resources.ShopOrder)
+    assert order.id == 99
+
+
+@responses.activate
+def test_delete_force_returns_deleted_resource(wcapi):
+    """DELETE with force maps to the deleted resource."""
+    responses.delete(f"{WC_API_URL}/products/7", json={"id": 7, "name": "Gone"})
+
+    response = wcapi.delete("products/7", force=True)
+
+    assert "force=true" in responses.calls[0].request.url
+    assert isinstance(response.data(), wc_resources.Product)
+    assert response.get_endpoint_match().params == {"id": "7"}
+
+
+@responses.activate
+def test_options_response_is_not_modelled(wcapi):
+    """OPTIONS responses describe the endpoint schema, read with json() as data() cannot map them."""
+    responses.add(responses.OPTIONS, f"{WC_API_URL}/products", json={"namespace": "wc/v3", "methods": ["GET"]})
+
+    response = wcapi.options("products")
+
+    assert response.json()["namespace"] == "wc/v3"
+    with pytest.raises(ValueError, match="Failed to map"):
+        response.data()
+
+
+@responses.activate
+def test_batch_response_is_not_validated_as_a_resource(wcapi):
+    """data() on a batch response fails instead of validating it as a single product."""
+    responses.post(f"{WC_API_URL}/products/batch", json={"create": [{"id": 1}], "update": [], "delete": []})
+
+    response = wcapi.post("products/batch", {"create": [{"name": "New"}]})
+
+    assert response.get_pydantic_model() is None
+    with pytest.raises(ValueError, match="Failed to map"):
+        response.data()